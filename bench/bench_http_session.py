@@ -0,0 +1,63 @@
+"""
+Compare per-call `requests.get` against pooled keep-alive sessions.
+
+Runs a local HTTP/1.1 stand-in server so the numbers reflect connection
+setup cost only. Against real TLS endpoints the gap is much wider.
+
+    python -m bench.bench_http_session [requests]
+"""
+import sys
+import json
+import time
+import threading
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.http_session import HTTPSessionPool
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = json.dumps({"orders": [], "hasMoreData": "false"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _time(label, fn, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        fn().json()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<22} {elapsed * 1000:9.1f} ms total "
+        f"{elapsed / count * 1e6:9.1f} us/request"
+    )
+
+
+def main(count: int = 2000):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/orderHistory"
+
+    pool = HTTPSessionPool()
+    try:
+        _time("requests.get", lambda: requests.get(url), count)
+        _time("HTTPSessionPool.get", lambda: pool.get(url), count)
+        for origin, stats in pool.stats().items():
+            print(f"{origin}: hits={stats.hits} misses={stats.misses}")
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
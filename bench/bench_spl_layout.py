@@ -0,0 +1,51 @@
+"""
+Decode thousands of token accounts with `decode_token_account` and with
+solders' `TokenAccount.from_bytes`, the path `Wallet.update_tokens` uses.
+
+    python -m bench.bench_spl_layout [accounts]
+"""
+import os
+import sys
+import time
+import struct
+from src.spl_layout import ACCOUNT_SIZE, decode_token_account
+
+
+def _accounts(count):
+    accounts = []
+    for i in range(count):
+        accounts.append(struct.pack(
+            "<32s32sQI32sBIQQI32s",
+            os.urandom(32), os.urandom(32), i * 1000, 0, bytes(32),
+            1, 0, 0, 0, 0, bytes(32)
+        ))
+        assert len(accounts[-1]) == ACCOUNT_SIZE
+    return accounts
+
+
+def _time(label, fn, accounts, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for data in accounts:
+            fn(data)
+        best = min(best, time.perf_counter() - start)
+    print(
+        f"{label:<28} {best * 1000:8.2f} ms "
+        f"{best / len(accounts) * 1e9:8.0f} ns/account"
+    )
+
+
+def main(count: int = 10_000):
+    accounts = _accounts(count)
+    _time("decode_token_account", decode_token_account, accounts)
+    try:
+        from solders.token.state import TokenAccount
+    except ImportError:
+        print("solders not installed, skipping TokenAccount.from_bytes")
+        return
+    _time("TokenAccount.from_bytes", TokenAccount.from_bytes, accounts)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
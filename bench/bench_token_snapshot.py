@@ -0,0 +1,70 @@
+"""
+Cold start of a token library: parse `tokens.json` into `Token` objects
+the way `TokenLibrary.load_tokens` does, versus opening a binary
+snapshot and looking up a handful of mints.
+
+    python -m bench.bench_token_snapshot [tokens]
+"""
+import sys
+import json
+import time
+import tempfile
+from pathlib import Path
+from src.tokens import Token
+from src.token_snapshot import TokenSnapshot, write_snapshot
+
+
+def _tokens(count):
+    return [
+        Token(
+            address=f"{i:08d}".rjust(44, "M"),
+            name=f"Token {i}",
+            symbol=f"T{i}",
+            decimals=i % 10
+        )
+        for i in range(count)
+    ]
+
+
+def _load_json(path, addresses):
+    with open(path, "r") as file:
+        tokens = {
+            entry["address"]: Token(**entry) for entry in json.load(file)
+        }
+    return [tokens[address] for address in addresses]
+
+
+def _load_snapshot(path, addresses):
+    with TokenSnapshot(path) as snapshot:
+        return [snapshot[address] for address in addresses]
+
+
+def _time(label, fn, *args, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<24} {best * 1000:10.3f} ms")
+
+
+def main(count: int = 50_000):
+    tokens = _tokens(count)
+    addresses = [t.address for t in tokens[::count // 10 or 1]]
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "tokens.json"
+        json_path.write_text(
+            json.dumps([t.model_dump() for t in tokens], indent=4)
+        )
+        snapshot_path = Path(tmp) / "tokens.snapshot"
+        write_snapshot(snapshot_path, tokens)
+        print(
+            f"{count} tokens: json {json_path.stat().st_size} bytes, "
+            f"snapshot {snapshot_path.stat().st_size} bytes"
+        )
+        _time("json + Token(**entry)", _load_json, json_path, addresses)
+        _time("snapshot + lookups", _load_snapshot, snapshot_path, addresses)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,177 @@
+import logging
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait
+)
+from dataclasses import dataclass, field, replace
+from time import monotonic
+from typing import Any, Dict, Mapping, Optional
+
+
+class BroadcastError(Exception):
+    def __init__(self, errors: Dict[str, BaseException]):
+        details = "; ".join(f"{url}: {e}" for url, e in errors.items())
+        super().__init__(f"Transaction rejected by every endpoint: {details}")
+        self.errors = errors
+
+
+class EndpointBusyError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class BroadcastResult:
+    signature: Any
+    endpoint: str
+    latency: float
+
+
+@dataclass
+class BroadcastStats:
+    sends: int = 0
+    accepted: int = 0
+    failures: int = 0
+    wins: int = 0
+    skipped: int = 0
+    total_latency: float = 0.0
+    win_latency: float = 0.0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        return self.total_latency / self.accepted if self.accepted else None
+
+    @property
+    def mean_win_latency(self) -> Optional[float]:
+        return self.win_latency / self.wins if self.wins else None
+
+
+class TransactionBroadcaster:
+    """
+    Sends the same signed transaction bytes to several RPC endpoints.
+
+    `clients` maps an endpoint name or URL to an object with solana-py's
+    `send_raw_transaction(txn, opts=None)`. The first accepted signature
+    is returned as soon as it arrives; the remaining sends finish in the
+    background and still count towards each endpoint's stats.
+
+    Each endpoint has its own pool of `max_in_flight` threads. An endpoint
+    that already has that many sends outstanding is skipped rather than
+    queued, so a hung endpoint cannot delay sends to the healthy ones.
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[str, Any],
+        timeout: Optional[float] = 30.0,
+        max_in_flight: int = 4
+    ):
+        if not clients:
+            raise ValueError("At least one RPC client is required")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._clients = dict(clients)
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self._executors = {
+            url: ThreadPoolExecutor(
+                max_workers=max_in_flight,
+                thread_name_prefix="tx-broadcast"
+            )
+            for url in self._clients
+        }
+        self._outstanding = {url: 0 for url in self._clients}
+        self._stats = {url: BroadcastStats() for url in self._clients}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def _send(self, url: str, raw_tx: bytes, opts: Any):
+        start = monotonic()
+        try:
+            response = self._clients[url].send_raw_transaction(raw_tx, opts)
+        except Exception as e:
+            with self._lock:
+                stats = self._stats[url]
+                stats.failures += 1
+                name = type(e).__name__
+                stats.errors[name] = stats.errors.get(name, 0) + 1
+            raise
+        latency = monotonic() - start
+        with self._lock:
+            stats = self._stats[url]
+            stats.accepted += 1
+            stats.total_latency += latency
+        return response.value, latency
+
+    def _finished(self, url: str):
+        with self._lock:
+            self._outstanding[url] -= 1
+
+    def broadcast(self, raw_tx: bytes, opts: Any = None) -> BroadcastResult:
+        pending: Dict[Future, str] = {}
+        errors: Dict[str, BaseException] = {}
+        ready = []
+        with self._lock:
+            for url in self._clients:
+                if self._outstanding[url] >= self.max_in_flight:
+                    self._stats[url].skipped += 1
+                    errors[url] = EndpointBusyError(
+                        f"{self._outstanding[url]} sends still outstanding"
+                    )
+                    continue
+                self._outstanding[url] += 1
+                self._stats[url].sends += 1
+                ready.append(url)
+        for url in ready:
+            future = self._executors[url].submit(
+                self._send, url, raw_tx, opts
+            )
+            future.add_done_callback(lambda _, url=url: self._finished(url))
+            pending[future] = url
+
+        deadline = None
+        if self.timeout is not None:
+            deadline = monotonic() + self.timeout
+        while pending:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - monotonic(), 0.0)
+            done, _ = wait(
+                pending, timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for future in done:
+                url = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    errors[url] = error
+                    continue
+                signature, latency = future.result()
+                with self._lock:
+                    stats = self._stats[url]
+                    stats.wins += 1
+                    stats.win_latency += latency
+                self._logger.debug(
+                    f"Transaction {signature} landed first via {url} "
+                    f"in {latency * 1000:.1f}ms"
+                )
+                return BroadcastResult(signature, url, latency)
+
+        for url in pending.values():
+            errors[url] = TimeoutError(f"No response within {self.timeout}s")
+        raise BroadcastError(errors)
+
+    def stats(self) -> Dict[str, BroadcastStats]:
+        with self._lock:
+            return {
+                url: replace(stats, errors=dict(stats.errors))
+                for url, stats in self._stats.items()
+            }
+
+    def shutdown(self):
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
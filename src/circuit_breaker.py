@@ -0,0 +1,331 @@
+import random
+import logging
+import threading
+from enum import Enum
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic, sleep
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Type
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(
+            f"Circuit '{name}' is open, retry in {retry_in:.2f}s"
+        )
+        self.name = name
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class BreakerSnapshot:
+    name: str
+    state: CircuitState
+    consecutive_failures: int
+    total_failures: int
+    total_successes: int
+    rejected: int
+    opened_at: Optional[float]
+
+
+def decorrelated_jitter(
+    previous: float,
+    base: float = 0.5,
+    cap: float = 30.0,
+    rng: Callable[[float, float], float] = random.uniform
+) -> float:
+    """Next backoff delay: uniform in [base, previous * 3], capped."""
+    return min(cap, rng(base, max(base, previous * 3)))
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures.
+
+    While open every call fails fast with `CircuitOpenError`. After
+    `recovery_timeout` seconds the breaker goes half-open and lets up to
+    `half_open_max_calls` trial calls through; a success closes it, a
+    failure re-opens it.
+
+    `before_call` returns the breaker's generation, which changes on
+    every state transition. Results reported with a generation from an
+    earlier state only count towards the totals, so a slow call admitted
+    before the breaker opened can neither close it nor extend the open
+    window. A trial that never reports back, because it was interrupted
+    or cancelled, frees its half-open slot after another
+    `recovery_timeout`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("Thresholds must be at least 1")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._total_failures = 0
+        self._total_successes = 0
+        self._rejected = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self._half_open_at: Optional[float] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def _transition(self, state: CircuitState):
+        self._state = state
+        self._generation += 1
+
+    def _update_state(self, now: float):
+        if (
+            self._state is CircuitState.OPEN
+            and now - self._opened_at >= self.recovery_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+            self._half_open_calls = 0
+            self._half_open_at = now
+        elif (
+            self._state is CircuitState.HALF_OPEN
+            and self._half_open_calls >= self.half_open_max_calls
+            and now - self._half_open_at >= self.recovery_timeout
+        ):
+            # Trials admitted this long ago are presumed lost.
+            self._half_open_calls = 0
+            self._half_open_at = now
+
+    def _is_stale(self, generation: Optional[int]) -> bool:
+        return generation is not None and generation != self._generation
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._update_state(monotonic())
+            return self._state
+
+    def before_call(self) -> int:
+        """Admit a call or raise `CircuitOpenError`; returns generation."""
+        with self._lock:
+            now = monotonic()
+            self._update_state(now)
+            if self._state is CircuitState.OPEN:
+                self._rejected += 1
+                raise CircuitOpenError(
+                    self.name,
+                    self.recovery_timeout - (now - self._opened_at)
+                )
+            if self._state is CircuitState.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    self._rejected += 1
+                    raise CircuitOpenError(self.name, 0.0)
+                self._half_open_calls += 1
+            return self._generation
+
+    def release(self, generation: int):
+        """Free the trial slot of a call that was interrupted."""
+        with self._lock:
+            if (
+                self._state is CircuitState.HALF_OPEN
+                and not self._is_stale(generation)
+                and self._half_open_calls > 0
+            ):
+                self._half_open_calls -= 1
+
+    def record_success(self, generation: Optional[int] = None):
+        with self._lock:
+            self._total_successes += 1
+            self._update_state(monotonic())
+            if (
+                self._is_stale(generation)
+                or self._state is CircuitState.OPEN
+            ):
+                return
+            self._consecutive_failures = 0
+            if self._state is CircuitState.HALF_OPEN:
+                self._logger.info(f"Circuit '{self.name}' closed")
+                self._transition(CircuitState.CLOSED)
+                self._opened_at = None
+
+    def record_failure(self, generation: Optional[int] = None):
+        with self._lock:
+            self._total_failures += 1
+            self._update_state(monotonic())
+            if (
+                self._is_stale(generation)
+                or self._state is CircuitState.OPEN
+            ):
+                return
+            self._consecutive_failures += 1
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+            ):
+                self._logger.warning(f"Circuit '{self.name}' opened")
+                self._transition(CircuitState.OPEN)
+                self._opened_at = monotonic()
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        generation = self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure(generation)
+            raise
+        except BaseException:
+            self.release(generation)
+            raise
+        self.record_success(generation)
+        return result
+
+    def snapshot(self) -> BreakerSnapshot:
+        with self._lock:
+            self._update_state(monotonic())
+            return BreakerSnapshot(
+                name=self.name,
+                state=self._state,
+                consecutive_failures=self._consecutive_failures,
+                total_failures=self._total_failures,
+                total_successes=self._total_successes,
+                rejected=self._rejected,
+                opened_at=self._opened_at
+            )
+
+
+class RetryBudget:
+    """
+    Caps retries to `ratio` of first attempts over a sliding `window`.
+
+    `min_retries` retries per window are always allowed so that a quiet
+    process can still recover from an isolated failure.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        window: float = 10.0,
+        min_retries: int = 3
+    ):
+        if ratio < 0 or window <= 0 or min_retries < 0:
+            raise ValueError("Invalid retry budget")
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float):
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] <= cutoff:
+                events.popleft()
+
+    def record_request(self):
+        with self._lock:
+            now = monotonic()
+            self._evict(now)
+            self._requests.append(now)
+
+    def try_acquire_retry(self) -> bool:
+        with self._lock:
+            now = monotonic()
+            self._evict(now)
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+    def usage(self) -> Tuple[int, int]:
+        with self._lock:
+            self._evict(monotonic())
+            return len(self._requests), len(self._retries)
+
+
+class CircuitBreakerRegistry:
+    """Process-wide breakers keyed by endpoint, plus one retry budget."""
+
+    _shared: Optional["CircuitBreakerRegistry"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        retry_budget: Optional[RetryBudget] = None,
+        **breaker_kwargs
+    ):
+        self.retry_budget = retry_budget or RetryBudget()
+        self._breaker_kwargs = breaker_kwargs
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls) -> "CircuitBreakerRegistry":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, **self._breaker_kwargs)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def snapshot(self) -> Dict[str, BreakerSnapshot]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.snapshot() for breaker in breakers}
+
+
+def call_with_breaker(
+    endpoint: str,
+    func: Callable[..., Any],
+    *args,
+    max_retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    registry: Optional[CircuitBreakerRegistry] = None,
+    **kwargs
+) -> Any:
+    """
+    Call `func` through the endpoint's breaker, retrying on failure.
+
+    Retries use decorrelated jitter and draw on the registry's shared
+    retry budget. An open circuit raises `CircuitOpenError` immediately
+    and an exhausted budget re-raises the last failure.
+    """
+    registry = registry or CircuitBreakerRegistry.get_shared()
+    breaker = registry.get(endpoint)
+    budget = registry.retry_budget
+    budget.record_request()
+
+    delay = base_delay
+    attempt = 0
+    while True:
+        try:
+            return breaker.call(func, *args, **kwargs)
+        except CircuitOpenError:
+            raise
+        except retry_on:
+            if attempt >= max_retries or not budget.try_acquire_retry():
+                raise
+        attempt += 1
+        delay = decorrelated_jitter(delay, base_delay, max_delay)
+        sleep(delay)
@@ -0,0 +1,235 @@
+import logging
+import threading
+from enum import Enum
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from src.event_dispatcher import KeyedEventDispatcher
+
+
+MAX_SIGNATURES_PER_REQUEST = 256
+MAX_SETTLED_SIGNATURES = 10_000
+
+_COMMITMENT_RANK = {"processed": 0, "confirmed": 1, "finalized": 2}
+
+
+class SignatureStatus(Enum):
+    PENDING = "pending"
+    CONFIRMED = "confirmed"
+    FAILED = "failed"
+    EXPIRED = "expired"
+
+
+def _commitment_name(value: Any) -> str:
+    # solders enums print as "TransactionConfirmationStatus.Confirmed"
+    return str(value).rsplit(".", 1)[-1].lower()
+
+
+class ConfirmationTracker:
+    """
+    Tracks sent transaction signatures until they land, fail or expire.
+
+    Pending signatures are checked with `get_signature_statuses` in
+    batches of up to 256. The poll interval drops to `min_interval`
+    whenever a status changes and backs off towards `max_interval` while
+    nothing does. Signatures tracked while others are pending wait for
+    the next scheduled poll, so the RPC rate follows the interval rather
+    than the rate of `track` calls. Outcomes are published through the
+    `confirmed`, `failed` and `expired` keyed dispatchers, keyed by
+    signature, and all three observers are unregistered once a signature
+    settles. Pass the observers to `track` rather than registering them
+    directly: it fires them at once for a signature that has already
+    settled instead of leaving them registered. A signature that has
+    landed below the required commitment is never expired.
+    """
+
+    def __init__(
+        self,
+        rpc_client: Any,
+        commitment: str = "confirmed",
+        expiry: float = 90.0,
+        min_interval: float = 0.4,
+        max_interval: float = 5.0
+    ):
+        if commitment not in _COMMITMENT_RANK:
+            raise ValueError(f"Unknown commitment: {commitment}")
+        self._rpc_client = rpc_client
+        self.commitment = commitment
+        self.expiry = expiry
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.confirmed = KeyedEventDispatcher()
+        self.failed = KeyedEventDispatcher()
+        self.expired = KeyedEventDispatcher()
+        self._dispatchers = {
+            SignatureStatus.CONFIRMED: self.confirmed,
+            SignatureStatus.FAILED: self.failed,
+            SignatureStatus.EXPIRED: self.expired
+        }
+        self._pending: Dict[Hashable, float] = {}
+        self._results: "OrderedDict[Hashable, SignatureStatus]" = (
+            OrderedDict()
+        )
+        self._errors: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._last_poll: Optional[float] = None
+        self._logger = logging.getLogger(__name__)
+
+    def track(
+        self,
+        signature: Hashable,
+        on_confirmed: Optional[Callable[[], None]] = None,
+        on_failed: Optional[Callable[[], None]] = None,
+        on_expired: Optional[Callable[[], None]] = None
+    ):
+        observers = {
+            SignatureStatus.CONFIRMED: on_confirmed,
+            SignatureStatus.FAILED: on_failed,
+            SignatureStatus.EXPIRED: on_expired
+        }
+        with self._lock:
+            settled = self._results.get(signature)
+            if settled is None:
+                for status, observer in observers.items():
+                    if observer is not None:
+                        self._dispatchers[status].register(
+                            signature, observer
+                        )
+                if signature in self._pending:
+                    return
+                idle = not self._pending
+                self._pending[signature] = monotonic()
+        if settled is not None:
+            observer = observers[settled]
+            if observer is not None:
+                self._call_observer(signature, settled, observer)
+            return
+        if idle:
+            # The worker is sleeping for max_interval with nothing to do.
+            self.interval = self.min_interval
+            self._wake.set()
+
+    def status(self, signature: Hashable) -> Optional[SignatureStatus]:
+        with self._lock:
+            if signature in self._pending:
+                return SignatureStatus.PENDING
+            return self._results.get(signature)
+
+    def error(self, signature: Hashable) -> Any:
+        with self._lock:
+            return self._errors.get(signature)
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _settle(self, signature, status: SignatureStatus, err=None):
+        with self._lock:
+            if self._pending.pop(signature, None) is None:
+                return
+            self._results[signature] = status
+            if err is not None:
+                self._errors[signature] = err
+            while len(self._results) > MAX_SETTLED_SIGNATURES:
+                oldest, _ = self._results.popitem(last=False)
+                self._errors.pop(oldest, None)
+        try:
+            self._call_observer(
+                signature, status,
+                lambda: self._dispatchers[status].notify(signature)
+            )
+        finally:
+            for dispatcher in self._dispatchers.values():
+                dispatcher.unregister(signature)
+
+    def _call_observer(
+        self,
+        signature: Hashable,
+        status: SignatureStatus,
+        observer: Callable[[], None]
+    ):
+        try:
+            observer()
+        except Exception as e:
+            self._logger.error(
+                f"Observer for {signature} ({status.value}) failed: {e}"
+            )
+
+    def poll_once(self) -> int:
+        """Check every pending signature once; returns RPC calls made."""
+        with self._lock:
+            pending = list(self._pending.items())
+        if not pending:
+            return 0
+
+        required = _COMMITMENT_RANK[self.commitment]
+        changed = False
+        calls = 0
+        for start in range(0, len(pending), MAX_SIGNATURES_PER_REQUEST):
+            chunk = pending[start:start + MAX_SIGNATURES_PER_REQUEST]
+            signatures: List[Hashable] = [s for s, _ in chunk]
+            try:
+                response = self._rpc_client.get_signature_statuses(
+                    signatures
+                )
+                calls += 1
+            except Exception as e:
+                self._logger.warning(f"get_signature_statuses failed: {e}")
+                continue
+
+            now = monotonic()
+            for (signature, tracked_at), status in zip(chunk, response.value):
+                if status is not None and status.err is not None:
+                    self._settle(signature, SignatureStatus.FAILED, status.err)
+                    changed = True
+                elif status is not None and status.confirmation_status and (
+                    _COMMITMENT_RANK.get(
+                        _commitment_name(status.confirmation_status), -1
+                    ) >= required
+                ):
+                    self._settle(signature, SignatureStatus.CONFIRMED)
+                    changed = True
+                elif status is None and now - tracked_at >= self.expiry:
+                    self._settle(signature, SignatureStatus.EXPIRED)
+                    changed = True
+
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 1.5, self.max_interval)
+        return calls
+
+    def start(self):
+        if self._worker is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.is_set():
+                self.poll_once()
+                self._last_poll = monotonic()
+                interval = self.interval
+                if self.pending_count == 0:
+                    interval = self.max_interval
+                self._wake.wait(interval)
+                self._wake.clear()
+                remaining = self._last_poll + self.min_interval - monotonic()
+                if remaining > 0:
+                    self._stop.wait(remaining)
+
+        self._worker = threading.Thread(
+            target=run, name="confirmation-tracker", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
@@ -0,0 +1,114 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from src.tokens import Token
+from src.http_session import HTTPSessionPool
+from src.rpc_batch import BatchRPCClient, chunked
+
+
+DEXSCREENER_TOKENS_URL = "https://api.dexscreener.com/tokens/v1/solana"
+MAX_TOKENS_PER_REQUEST = 30
+
+
+class DEXScreenerBatchClient:
+    """
+    Resolves token names and symbols for many mints at once.
+
+    `tokens/v1/solana` accepts up to 30 comma-separated addresses, so
+    addresses are chunked and the chunks fetched concurrently through the
+    shared session pool, whose rate limiter keeps the fan-out within
+    DEXScreener's budget.
+    """
+
+    def __init__(
+        self,
+        session_pool: Optional[HTTPSessionPool] = None,
+        concurrency: int = 4,
+        base_url: str = DEXSCREENER_TOKENS_URL
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._session_pool = session_pool or HTTPSessionPool.get_shared()
+        self.concurrency = concurrency
+        self.base_url = base_url.rstrip("/")
+        self._logger = logging.getLogger(__name__)
+
+    def _fetch_chunk(self, addresses: Sequence[str]) -> List[Dict[str, Any]]:
+        response = self._session_pool.get(
+            f"{self.base_url}/{','.join(addresses)}"
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _match_pairs(
+        addresses: Sequence[str], pairs: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, str]]:
+        wanted = set(addresses)
+        info: Dict[str, Dict[str, str]] = {}
+        for pair in pairs:
+            for side in ("baseToken", "quoteToken"):
+                token = pair.get(side) or {}
+                address = token.get("address")
+                if address in wanted and address not in info:
+                    info[address] = {
+                        "name": token.get("name", ""),
+                        "symbol": token.get("symbol", "")
+                    }
+        return info
+
+    def get_tokens_info(
+        self, addresses: Sequence[str]
+    ) -> Dict[str, Optional[Dict[str, str]]]:
+        """
+        Name and symbol for each address, or None if DEXScreener has no
+        pairs for it. An HTTP error on any chunk is raised once every
+        chunk has finished.
+        """
+        unique = list(dict.fromkeys(addresses))
+        chunks = list(chunked(unique, MAX_TOKENS_PER_REQUEST))
+        info: Dict[str, Optional[Dict[str, str]]] = dict.fromkeys(unique)
+        if not chunks:
+            return info
+        workers = min(self.concurrency, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._fetch_chunk, chunk) for chunk in chunks
+            ]
+        for chunk, future in zip(chunks, futures):
+            info.update(self._match_pairs(chunk, future.result()))
+        return info
+
+
+def resolve_tokens(
+    addresses: Sequence[str],
+    rpc_client: BatchRPCClient,
+    dexscreener: Optional[DEXScreenerBatchClient] = None
+) -> Tuple[Dict[str, Token], Dict[str, str]]:
+    """
+    Resolve `addresses` to `Token`s with batched DEXScreener and
+    `getMultipleAccounts` lookups.
+
+    Returns the resolved tokens and, for every address that could not be
+    resolved, the reason, ready for `TokenStore.record_failure`.
+    """
+    dexscreener = dexscreener or DEXScreenerBatchClient()
+    info = dexscreener.get_tokens_info(addresses)
+    listed = [address for address, entry in info.items() if entry]
+    decimals = rpc_client.get_mint_decimals(listed)
+
+    tokens: Dict[str, Token] = {}
+    failures: Dict[str, str] = {}
+    for address, entry in info.items():
+        if not entry:
+            failures[address] = "no DEXScreener pairs"
+        elif decimals.get(address) is None:
+            failures[address] = "mint decimals unavailable"
+        else:
+            tokens[address] = Token(
+                address=address,
+                name=entry["name"],
+                symbol=entry["symbol"],
+                decimals=decimals[address]
+            )
+    return tokens, failures
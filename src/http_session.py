@@ -0,0 +1,142 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from src.rate_limiter import RateLimiter
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    host: str
+    connections: int
+    requests: int
+
+    @property
+    def hits(self) -> int:
+        return max(self.requests - self.connections, 0)
+
+    @property
+    def misses(self) -> int:
+        return self.connections
+
+
+class HTTPSessionPool:
+    """
+    Keep-alive `requests.Session` objects, one per scheme and host.
+
+    Each session mounts an `HTTPAdapter` sized by `pool_connections` and
+    `pool_maxsize`, so repeated calls to the same API reuse open TCP/TLS
+    connections instead of handshaking on every request. Retries are left
+    to `src.backoff`, so the adapter itself never retries.
+
+    When a `rate_limiter` is given, every request first acquires a token
+    for its host, and a 429 response's `Retry-After` pauses that host.
+    """
+
+    _shared: Optional["HTTPSessionPool"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        timeout: Optional[float] = 10.0,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("Pool sizes must be at least 1")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self._sessions: Dict[str, requests.Session] = {}
+        self._adapters: Dict[str, HTTPAdapter] = {}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    @classmethod
+    def get_shared(cls) -> "HTTPSessionPool":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(rate_limiter=RateLimiter.get_shared())
+            return cls._shared
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parts = urlsplit(url)
+        if not parts.scheme or not parts.netloc:
+            raise ValueError(f"Invalid URL: {url}")
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def session(self, url: str) -> requests.Session:
+        origin = self._origin(url)
+        with self._lock:
+            session = self._sessions.get(origin)
+            if session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                    max_retries=0
+                )
+                session = requests.Session()
+                session.mount(origin, adapter)
+                self._sessions[origin] = session
+                self._adapters[origin] = adapter
+                self._logger.debug(f"Opened HTTP session for {origin}")
+            return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        session = self.session(url)
+        host = urlsplit(url).hostname
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(host)
+        response = session.request(method=method, url=url, **kwargs)
+        if self.rate_limiter is not None and response.status_code == 429:
+            self.rate_limiter.honour_retry_after(
+                host, response.headers.get("Retry-After")
+            )
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, PoolStats]:
+        stats: Dict[str, PoolStats] = {}
+        with self._lock:
+            adapters = list(self._adapters.items())
+        for origin, adapter in adapters:
+            connections = 0
+            requests_made = 0
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += pool.num_connections
+                requests_made += pool.num_requests
+            stats[origin] = PoolStats(
+                host=origin,
+                connections=connections,
+                requests=requests_made
+            )
+        return stats
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._adapters.clear()
+        for session in sessions:
+            session.close()
@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+PageFetcher = Callable[[int], Awaitable[Dict[str, Any]]]
+
+
+def has_more_data(page: Dict[str, Any]) -> bool:
+    """Jupiter sends `hasMoreData` as either a bool or "true"/"false"."""
+    value = page.get("hasMoreData", False)
+    if isinstance(value, str):
+        return value.strip().lower() == "true"
+    return bool(value)
+
+
+async def fetch_all_pages(
+    fetch_page: PageFetcher,
+    concurrency: int = 4,
+    first_page: int = 1,
+    max_pages: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch consecutive pages until one reports `hasMoreData` false.
+
+    Up to `concurrency` pages are requested speculatively ahead of the
+    last page seen, so a history of N pages costs roughly
+    N / concurrency round trips. Pages past the end are cancelled or
+    discarded, along with any errors they raised. Pages are returned in
+    order; an error from a page within the history stops further
+    requests and is re-raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    results: Dict[int, Dict[str, Any]] = {}
+    errors: Dict[int, Exception] = {}
+    in_flight: Dict[asyncio.Task, int] = {}
+    discarded: List[asyncio.Task] = []
+    next_page = first_page
+    last_page = None
+    if max_pages is not None:
+        last_page = first_page + max_pages - 1
+
+    def limit() -> Optional[int]:
+        # Nothing after a failed page is needed unless an earlier page
+        # turns out to be the last one, so stop there either way.
+        candidates = [last_page] if last_page is not None else []
+        if errors:
+            candidates.append(min(errors))
+        return min(candidates) if candidates else None
+
+    try:
+        while True:
+            while len(in_flight) < concurrency and (
+                limit() is None or next_page <= limit()
+            ):
+                task = asyncio.ensure_future(fetch_page(next_page))
+                in_flight[task] = next_page
+                next_page += 1
+
+            if not in_flight:
+                break
+
+            done, _ = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                page_number = in_flight.pop(task)
+                try:
+                    page = task.result()
+                except Exception as e:
+                    errors[page_number] = e
+                    continue
+                results[page_number] = page
+                if not has_more_data(page) and (
+                    last_page is None or page_number < last_page
+                ):
+                    last_page = page_number
+
+            if limit() is not None:
+                for task, page_number in list(in_flight.items()):
+                    if page_number > limit():
+                        task.cancel()
+                        discarded.append(task)
+                        del in_flight[task]
+    finally:
+        for task in in_flight:
+            task.cancel()
+            discarded.append(task)
+        await asyncio.gather(*discarded, return_exceptions=True)
+
+    pages = []
+    page_number = first_page
+    while last_page is None or page_number <= last_page:
+        if page_number in errors:
+            raise errors[page_number]
+        if page_number not in results:
+            break
+        pages.append(results[page_number])
+        page_number += 1
+    return pages
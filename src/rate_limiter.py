@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep
+from typing import Dict, Optional, Tuple
+
+
+@dataclass
+class WaitStats:
+    acquired: int = 0
+    waited: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return a `Retry-After` header (seconds or HTTP-date) in seconds."""
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return max(delay, 0.0)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second up to `capacity`.
+
+    Callers reserve a token under a lock and then wait outside it, so the
+    same bucket can be shared by threads and by asyncio tasks without
+    blocking the event loop. Reservations queue by letting the balance go
+    negative, which keeps waiters in FIFO order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        if self.capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._tokens = self.capacity
+        self._updated = monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.stats = WaitStats()
+
+    def _refill(self, now: float):
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - start) * self.rate
+            )
+        self._updated = max(self._updated, now)
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait."""
+        with self._lock:
+            now = monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(self._blocked_until - now, 0.0)
+            if self._tokens < 0:
+                delay += -self._tokens / self.rate
+            self.stats.acquired += 1
+            if delay > 0:
+                self.stats.waited += 1
+                self.stats.total_wait += delay
+                self.stats.max_wait = max(self.stats.max_wait, delay)
+            return delay
+
+    def block_for(self, seconds: float):
+        """Stop handing out tokens for `seconds`, e.g. after a 429."""
+        with self._lock:
+            now = monotonic()
+            self._refill(now)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = min(self._tokens, 1.0)
+
+    def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """
+    Per-endpoint token buckets shared by every API client in the process.
+
+    `budgets` maps an endpoint key (normally the API host, for example
+    "api.jup.ag") to `(rate, capacity)`. Endpoints without an explicit
+    budget get their own bucket built from `default_budget`.
+    """
+
+    _shared: Optional["RateLimiter"] = None
+    _shared_lock = threading.Lock()
+
+    DEFAULT_BUDGETS: Dict[str, Tuple[float, float]] = {
+        "api.jup.ag": (1.0, 1.0),
+        "api.dexscreener.com": (5.0, 5.0),
+    }
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, Tuple[float, float]]] = None,
+        default_budget: Tuple[float, float] = (10.0, 10.0)
+    ):
+        self._budgets = dict(
+            self.DEFAULT_BUDGETS if budgets is None else budgets
+        )
+        self._default_budget = default_budget
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    @classmethod
+    def get_shared(cls) -> "RateLimiter":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                rate, capacity = self._budgets.get(
+                    endpoint, self._default_budget
+                )
+                bucket = TokenBucket(rate, capacity)
+                self._buckets[endpoint] = bucket
+            return bucket
+
+    def acquire(self, endpoint: str) -> float:
+        return self.bucket(endpoint).acquire()
+
+    async def acquire_async(self, endpoint: str) -> float:
+        return await self.bucket(endpoint).acquire_async()
+
+    def honour_retry_after(
+        self, endpoint: str, retry_after: Optional[str]
+    ) -> Optional[float]:
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            self._logger.warning(
+                f"Rate limited by {endpoint}, pausing for {delay:.2f}s"
+            )
+            self.bucket(endpoint).block_for(delay)
+        return delay
+
+    def stats(self) -> Dict[str, WaitStats]:
+        with self._lock:
+            return {
+                endpoint: replace(bucket.stats)
+                for endpoint, bucket in self._buckets.items()
+            }
@@ -0,0 +1,163 @@
+import base64
+import logging
+import itertools
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from src.http_session import HTTPSessionPool
+from src.spl_layout import TOKEN_PROGRAM_IDS, LayoutError, decode_mint
+
+
+MAX_MULTIPLE_ACCOUNTS = 100
+
+
+class RPCError(Exception):
+    def __init__(self, code: Optional[int], message: str):
+        super().__init__(f"RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+def chunked(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class BatchRPCClient:
+    """
+    Minimal JSON-RPC client that can send many calls in one HTTP request.
+
+    Complements the solana-py `Client` returned by `SolanaRPC.get_client`,
+    which has no batch support.
+    """
+
+    def __init__(
+        self, rpc_url: str, session_pool: Optional[HTTPSessionPool] = None
+    ):
+        self.rpc_url = rpc_url
+        self._session_pool = session_pool or HTTPSessionPool.get_shared()
+        self._ids = itertools.count(1)
+        self._ids_lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def _next_id(self) -> int:
+        with self._ids_lock:
+            return next(self._ids)
+
+    @staticmethod
+    def _unwrap(reply: Dict[str, Any]) -> Any:
+        if "error" in reply and reply["error"] is not None:
+            error = reply["error"]
+            raise RPCError(error.get("code"), error.get("message", ""))
+        return reply.get("result")
+
+    def _post(self, payload: Any) -> Any:
+        response = self._session_pool.post(self.rpc_url, json=payload)
+        response.raise_for_status()
+        try:
+            return response.json()
+        except ValueError as e:
+            raise RPCError(None, f"Invalid JSON response: {e}")
+
+    def call(self, method: str, params: Optional[list] = None) -> Any:
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._next_id(),
+            "method": method,
+            "params": params or []
+        }
+        return self._unwrap(self._post(payload))
+
+    def batch(
+        self,
+        calls: Sequence[Tuple[str, Optional[list]]],
+        raise_errors: bool = True
+    ) -> List[Any]:
+        """
+        Send `calls` as one JSON-RPC batch and return results in order.
+
+        With `raise_errors` false, failed entries are returned as
+        `RPCError` instances instead of raising.
+        """
+        if not calls:
+            return []
+        ids = [self._next_id() for _ in calls]
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params or []
+            }
+            for request_id, (method, params) in zip(ids, calls)
+        ]
+        replies = self._post(payload)
+        if isinstance(replies, dict):
+            # Servers answer a batch they cannot parse with one error.
+            self._unwrap(replies)
+            raise RPCError(None, "Expected a batch response")
+
+        by_id = {reply.get("id"): reply for reply in replies}
+        results = []
+        for request_id in ids:
+            reply = by_id.get(request_id)
+            if reply is None:
+                error = RPCError(None, f"Missing reply for id {request_id}")
+                if raise_errors:
+                    raise error
+                results.append(error)
+                continue
+            try:
+                results.append(self._unwrap(reply))
+            except RPCError as e:
+                if raise_errors:
+                    raise
+                results.append(e)
+        return results
+
+    def get_multiple_accounts(
+        self, addresses: Sequence[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch accounts in `getMultipleAccounts` chunks of 100, all sent in
+        a single batch request.
+        """
+        chunks = list(chunked(list(addresses), MAX_MULTIPLE_ACCOUNTS))
+        calls = [
+            ("getMultipleAccounts", [list(chunk), {"encoding": "base64"}])
+            for chunk in chunks
+        ]
+        accounts: Dict[str, Optional[Dict[str, Any]]] = {}
+        for chunk, result in zip(chunks, self.batch(calls)):
+            values = result["value"] if result is not None else []
+            if len(values) != len(chunk):
+                raise RPCError(
+                    None,
+                    f"Expected {len(chunk)} accounts, got {len(values)}"
+                )
+            accounts.update(zip(chunk, values))
+        return accounts
+
+    def get_mint_decimals(
+        self, mints: Sequence[str]
+    ) -> Dict[str, Optional[int]]:
+        """
+        Decimals for each mint, decoded locally from the mint account.
+
+        Missing accounts, accounts not owned by the Token or Token-2022
+        program, and malformed mints map to None.
+        """
+        decimals: Dict[str, Optional[int]] = {}
+        unique = list(dict.fromkeys(mints))
+        for mint, account in self.get_multiple_accounts(unique).items():
+            decimals[mint] = None
+            if account is None:
+                continue
+            if account.get("owner") not in TOKEN_PROGRAM_IDS:
+                self._logger.warning(f"{mint} is not a token mint")
+                continue
+            try:
+                data = base64.b64decode(account["data"][0])
+                decimals[mint] = decode_mint(data).decimals
+            except (LayoutError, KeyError, IndexError, ValueError) as e:
+                self._logger.warning(f"Could not decode mint {mint}: {e}")
+        return decimals
@@ -0,0 +1,206 @@
+import logging
+import threading
+from dataclasses import dataclass, replace
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+
+class NoHealthyEndpointError(Exception):
+    pass
+
+
+@dataclass
+class EndpointStats:
+    url: str
+    ewma_latency: Optional[float] = None
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejected_until: Optional[float] = None
+    last_error: Optional[str] = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.ejected_until is None
+
+
+class RPCEndpointPool:
+    """
+    Routes RPC calls to the fastest healthy endpoint.
+
+    Latency is tracked per endpoint as an EWMA over successful calls and
+    probes. Endpoints without a sample are tried first so each one gets
+    measured, unless they have already failed, in which case they rank
+    behind every endpoint that has answered. `failure_threshold`
+    consecutive failures eject an endpoint for `ejection_time` seconds;
+    a successful probe or call puts it back. When the ejection expires
+    the endpoint gets a single trial: one more failure ejects it again.
+    If every endpoint is ejected, the one due back first is used rather
+    than failing outright.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        client_factory: Callable[[str], Any],
+        alpha: float = 0.3,
+        failure_threshold: int = 3,
+        ejection_time: float = 30.0,
+        probe: Optional[Callable[[Any], Any]] = None,
+        probe_interval: float = 10.0
+    ):
+        if not urls:
+            raise ValueError("At least one RPC endpoint is required")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self.probe_interval = probe_interval
+        self._probe = probe or (lambda client: client.get_slot())
+        self._urls: List[str] = list(dict.fromkeys(urls))
+        self._clients = {url: client_factory(url) for url in self._urls}
+        self._stats = {url: EndpointStats(url=url) for url in self._urls}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+        self._logger = logging.getLogger(__name__)
+
+    def _readmit_expired(self, now: float):
+        for stats in self._stats.values():
+            if stats.ejected_until is not None and now >= stats.ejected_until:
+                stats.ejected_until = None
+                stats.consecutive_failures = self.failure_threshold - 1
+
+    @staticmethod
+    def _rank(stats: EndpointStats):
+        if stats.ewma_latency is not None:
+            return (1, stats.ewma_latency)
+        if stats.consecutive_failures == 0:
+            return (0, 0.0)
+        return (2, 0.0)
+
+    def select(self) -> str:
+        with self._lock:
+            self._readmit_expired(monotonic())
+            healthy = [s for s in self._stats.values() if s.healthy]
+            if not healthy:
+                return min(
+                    self._stats.values(), key=lambda s: s.ejected_until
+                ).url
+            return min(healthy, key=self._rank).url
+
+    def client(self, url: Optional[str] = None) -> Any:
+        """
+        The raw client for `url` or the best endpoint. Calls made on it
+        bypass health tracking; use `call` or `tracked_client` for
+        traffic that should feed latency and ejection.
+        """
+        return self._clients[url or self.select()]
+
+    def tracked_client(self) -> "TrackedClient":
+        return TrackedClient(self)
+
+    def record_success(self, url: str, latency: float):
+        with self._lock:
+            stats = self._stats[url]
+            stats.successes += 1
+            stats.consecutive_failures = 0
+            if stats.ejected_until is not None:
+                self._logger.info(f"RPC endpoint {url} back in rotation")
+            stats.ejected_until = None
+            if stats.ewma_latency is None:
+                stats.ewma_latency = latency
+            else:
+                stats.ewma_latency = (
+                    self.alpha * latency
+                    + (1 - self.alpha) * stats.ewma_latency
+                )
+
+    def record_failure(self, url: str, error: BaseException):
+        with self._lock:
+            stats = self._stats[url]
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            stats.last_error = str(error)
+            if (
+                stats.ejected_until is None
+                and stats.consecutive_failures >= self.failure_threshold
+            ):
+                self._logger.warning(
+                    f"Ejecting RPC endpoint {url} after "
+                    f"{stats.consecutive_failures} failures: {error}"
+                )
+                stats.ejected_until = monotonic() + self.ejection_time
+
+    def call(self, func: Callable[[Any], T]) -> T:
+        """Run `func(client)` on the best endpoint and record the outcome."""
+        url = self.select()
+        start = monotonic()
+        try:
+            result = func(self._clients[url])
+        except Exception as e:
+            self.record_failure(url, e)
+            raise
+        self.record_success(url, monotonic() - start)
+        return result
+
+    def probe_all(self):
+        for url in self._urls:
+            start = monotonic()
+            try:
+                self._probe(self._clients[url])
+            except Exception as e:
+                self.record_failure(url, e)
+            else:
+                self.record_success(url, monotonic() - start)
+
+    def start(self):
+        if self._prober is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.is_set():
+                self.probe_all()
+                self._stop.wait(self.probe_interval)
+
+        self._prober = threading.Thread(
+            target=run, name="rpc-endpoint-prober", daemon=True
+        )
+        self._prober.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._prober is not None:
+            self._prober.join()
+            self._prober = None
+
+    def stats(self) -> Dict[str, EndpointStats]:
+        with self._lock:
+            self._readmit_expired(monotonic())
+            return {url: replace(s) for url, s in self._stats.items()}
+
+
+class TrackedClient:
+    """
+    Stands in for an RPC client, routing every method call through
+    `RPCEndpointPool.call` so real traffic is measured like probes are.
+    """
+
+    def __init__(self, pool: RPCEndpointPool):
+        self._pool = pool
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._pool.client(), name)
+        if not callable(attribute):
+            return attribute
+
+        def method(*args, **kwargs):
+            return self._pool.call(
+                lambda client: getattr(client, name)(*args, **kwargs)
+            )
+        return method
@@ -0,0 +1,174 @@
+import os
+import fcntl
+import logging
+import threading
+from pathlib import Path
+from time import monotonic
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple
+from src.tokens import Token
+from src.write_behind import WriteBehindWriter
+from src.token_snapshot import SnapshotError, TokenSnapshot, write_snapshot
+
+
+class IndexLockedError(RuntimeError):
+    pass
+
+
+class TokenIndexPublisher:
+    """
+    The single writer of a shared token index.
+
+    New tokens are batched by a `WriteBehindWriter` and published as a
+    fresh snapshot with the next generation number, swapped in by an
+    atomic rename so readers never see a partial file. An exclusive lock
+    on a sibling `.lock` file is held until `close()`, so a second
+    publisher for the same path fails with `IndexLockedError` instead of
+    overwriting the first one's tokens.
+    """
+
+    def __init__(self, path: Path, delay: float = 1.0):
+        self.path = Path(path)
+        self.delay = delay
+        self._tokens: Dict[str, Token] = {}
+        self.generation = 0
+        self._logger = logging.getLogger(__name__)
+        self._lock_file = self._acquire_lock()
+        try:
+            if self.path.exists():
+                with TokenSnapshot(self.path) as snapshot:
+                    self._tokens = dict(snapshot.items())
+                    self.generation = snapshot.generation
+        except BaseException:
+            self._release_lock()
+            raise
+        self._writer = WriteBehindWriter(
+            self._publish, delay=delay, name="token-index"
+        )
+
+    @property
+    def lock_path(self) -> Path:
+        return self.path.with_name(f"{self.path.name}.lock")
+
+    def _acquire_lock(self):
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            raise IndexLockedError(
+                f"Another publisher holds {self.lock_path}"
+            )
+        return lock_file
+
+    def _release_lock(self):
+        if self._lock_file is None:
+            return
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+        self._lock_file.close()
+        self._lock_file = None
+
+    def add_token(self, token: Token):
+        self._writer.mark_dirty(token.address, token)
+
+    def add_tokens(self, tokens: Iterable[Token]):
+        for token in tokens:
+            self.add_token(token)
+
+    def _publish(self, batch: Dict[str, Token]):
+        tokens = {**self._tokens, **batch}
+        write_snapshot(self.path, tokens.values(), self.generation + 1)
+        self._tokens = tokens
+        self.generation += 1
+        self._logger.debug(
+            f"Published {len(tokens)} tokens as generation "
+            f"{self.generation}"
+        )
+
+    def publish(self) -> int:
+        """Publish pending tokens now, returning how many were written."""
+        return self._writer.flush()
+
+    def close(self):
+        try:
+            self._writer.close()
+        finally:
+            self._release_lock()
+
+
+class SharedTokenIndex(Mapping):
+    """
+    Read-only token lookups over a snapshot published by another process.
+
+    The snapshot is memory-mapped, so every reader shares the same page
+    cache and only holds the tokens it has actually looked up. At most
+    every `refresh_interval` seconds a lookup stats the file and remaps it
+    if the publisher has replaced it, so a token added by the publisher is
+    visible to readers within its `delay` plus `refresh_interval`.
+    """
+
+    def __init__(self, path: Path, refresh_interval: float = 1.0):
+        self.path = Path(path)
+        self.refresh_interval = refresh_interval
+        self._snapshot: Optional[TokenSnapshot] = None
+        self._file_id: Optional[Tuple[int, int, int]] = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> bool:
+        """Remap the snapshot if it changed. Returns True if it did."""
+        with self._lock:
+            now = monotonic()
+            if not force and self._checked_at is not None and (
+                now - self._checked_at < self.refresh_interval
+            ):
+                return False
+            self._checked_at = now
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return False
+            file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if file_id == self._file_id:
+                return False
+            try:
+                snapshot = TokenSnapshot(self.path)
+            except (OSError, SnapshotError) as e:
+                self._logger.error(f"Error opening token index: {e}")
+                return False
+            # The previous map is released once in-flight lookups drop
+            # their reference to it.
+            self._snapshot = snapshot
+            self._file_id = file_id
+            self._logger.debug(
+                f"Loaded token index generation {snapshot.generation}"
+            )
+            return True
+
+    def _current(self) -> Optional[TokenSnapshot]:
+        self.refresh()
+        return self._snapshot
+
+    @property
+    def generation(self) -> int:
+        snapshot = self._current()
+        return snapshot.generation if snapshot is not None else 0
+
+    def __getitem__(self, address: str) -> Token:
+        snapshot = self._current()
+        if snapshot is None:
+            raise KeyError(address)
+        return snapshot[address]
+
+    def __contains__(self, address: object) -> bool:
+        snapshot = self._current()
+        return snapshot is not None and address in snapshot
+
+    def __iter__(self) -> Iterator[str]:
+        snapshot = self._current()
+        return iter(snapshot) if snapshot is not None else iter(())
+
+    def __len__(self) -> int:
+        snapshot = self._current()
+        return len(snapshot) if snapshot is not None else 0
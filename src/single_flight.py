@@ -0,0 +1,93 @@
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    executed: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlightError(Exception):
+    def __init__(self, key: Hashable):
+        super().__init__(f"Shared call for {key!r} failed")
+        self.key = key
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while
+    it is in flight block until it finishes and receive the same result.
+    If it raises, each waiter raises its own copy of the exception,
+    chained to the original, so concurrent tracebacks stay separate;
+    exceptions that cannot be copied surface as `SingleFlightError`.
+    Nothing is cached afterwards: the next call for the key runs again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(
+        self, key: Hashable, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise self._waiter_error(key, call.error) from call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    @staticmethod
+    def _waiter_error(key: Hashable, error: BaseException) -> BaseException:
+        try:
+            waiter_error = copy.copy(error)
+        except Exception:
+            return SingleFlightError(key)
+        if waiter_error is error or type(waiter_error) is not type(error):
+            return SingleFlightError(key)
+        return waiter_error
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                executed=self._executed,
+                coalesced=self._coalesced,
+                in_flight=len(self._calls)
+            )
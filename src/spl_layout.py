@@ -0,0 +1,82 @@
+import struct
+from dataclasses import dataclass
+from typing import Tuple
+
+
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+TOKEN_PROGRAM_IDS = frozenset({TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID})
+
+MINT_SIZE = 82
+ACCOUNT_SIZE = 165
+# Token-2022 pads mints to ACCOUNT_SIZE and stores the account type at
+# this offset before the TLV extension area.
+ACCOUNT_TYPE_OFFSET = ACCOUNT_SIZE
+ACCOUNT_TYPE_MINT = 1
+ACCOUNT_TYPE_ACCOUNT = 2
+
+_MINT_SUPPLY_OFFSET = 36
+_MINT_DECIMALS_OFFSET = 44
+_MINT_INITIALIZED_OFFSET = 45
+
+_ACCOUNT_MINT_END = 32
+_ACCOUNT_AMOUNT_OFFSET = 64
+_ACCOUNT_STATE_OFFSET = 108
+_ACCOUNT_STATE_UNINITIALIZED = 0
+
+_U64 = struct.Struct("<Q")
+
+
+class LayoutError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class MintInfo:
+    supply: int
+    decimals: int
+    is_initialized: bool
+
+
+def _check_account_type(data, expected: int, base_size: int, kind: str):
+    if len(data) < base_size:
+        raise LayoutError(f"{kind} data too short: {len(data)} bytes")
+    if len(data) > base_size:
+        if len(data) <= ACCOUNT_TYPE_OFFSET:
+            raise LayoutError(
+                f"Unexpected {kind} data length: {len(data)} bytes"
+            )
+        if data[ACCOUNT_TYPE_OFFSET] != expected:
+            raise LayoutError(
+                f"Account type {data[ACCOUNT_TYPE_OFFSET]} is not a {kind}"
+            )
+
+
+def decode_mint(data: bytes) -> MintInfo:
+    """Decode an SPL Token or Token-2022 mint account."""
+    view = memoryview(data)
+    _check_account_type(view, ACCOUNT_TYPE_MINT, MINT_SIZE, "mint")
+    supply, = _U64.unpack_from(view, _MINT_SUPPLY_OFFSET)
+    return MintInfo(
+        supply=supply,
+        decimals=view[_MINT_DECIMALS_OFFSET],
+        is_initialized=bool(view[_MINT_INITIALIZED_OFFSET])
+    )
+
+
+def decode_token_account(data) -> Tuple[memoryview, int]:
+    """
+    Read only the mint and amount of an SPL Token or Token-2022 account.
+
+    Returns a 32-byte memoryview of the mint over `data` (no copy) and
+    the raw u64 amount. Token-2022 extension tails are accepted once the
+    account-type byte confirms the data is a token account.
+    """
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    _check_account_type(
+        view, ACCOUNT_TYPE_ACCOUNT, ACCOUNT_SIZE, "token account"
+    )
+    if view[_ACCOUNT_STATE_OFFSET] == _ACCOUNT_STATE_UNINITIALIZED:
+        raise LayoutError("Token account is not initialized")
+    amount, = _U64.unpack_from(view, _ACCOUNT_AMOUNT_OFFSET)
+    return view[:_ACCOUNT_MINT_END], amount
@@ -0,0 +1,166 @@
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Mapping, Optional
+from src.tokens import Token
+from src.write_behind import atomic_write_bytes
+
+# Layout, all little-endian:
+#   header  magic, version, reserved, generation u64, count u32
+#   index   `count` fixed-size entries sorted by address bytes
+#   strings address, name and symbol of each entry, UTF-8, back to back
+MAGIC = b"JGTS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQI4x")
+ENTRY = struct.Struct("<IHHHBx")
+MAX_STRING_LENGTH = 0xFFFF
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def encode_snapshot(tokens: Iterable[Token], generation: int = 0) -> bytes:
+    by_address = {t.address.encode(): t for t in tokens}
+    index = bytearray()
+    strings = bytearray()
+    for address in sorted(by_address):
+        token = by_address[address]
+        name = token.name.encode()
+        symbol = token.symbol.encode()
+        if max(len(address), len(name), len(symbol)) > MAX_STRING_LENGTH:
+            raise SnapshotError(f"Token {token.address} field too long")
+        index += ENTRY.pack(
+            len(strings), len(address), len(name), len(symbol),
+            token.decimals
+        )
+        strings += address + name + symbol
+    header = HEADER.pack(MAGIC, VERSION, 0, generation, len(by_address))
+    return header + bytes(index) + bytes(strings)
+
+
+def write_snapshot(
+    path: Path, tokens: Iterable[Token], generation: int = 0
+):
+    """Atomically replace the snapshot at `path` with `tokens`."""
+    atomic_write_bytes(path, encode_snapshot(tokens, generation))
+
+
+class TokenSnapshot(Mapping):
+    """
+    Read-only, memory-mapped view of a token snapshot keyed by address.
+
+    Opening a snapshot only maps the file and checks its header. Lookups
+    binary-search the sorted index in place, and a `Token` is built the
+    first time its address is read and cached after that.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            try:
+                self._mm = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                raise SnapshotError(f"{self.path} is empty")
+        try:
+            self._read_header()
+        except SnapshotError:
+            self._mm.close()
+            raise
+        self._tokens: Dict[str, Token] = {}
+
+    def _read_header(self):
+        if len(self._mm) < HEADER.size:
+            raise SnapshotError(f"{self.path} is truncated")
+        magic, version, _, generation, count = HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            raise SnapshotError(f"{self.path} is not a token snapshot")
+        if version != VERSION:
+            raise SnapshotError(
+                f"Unsupported token snapshot version {version}"
+            )
+        self.generation = generation
+        self._count = count
+        self._strings = HEADER.size + count * ENTRY.size
+        if len(self._mm) < self._strings:
+            raise SnapshotError(f"{self.path} is truncated")
+        if count:
+            offset, address_len, name_len, symbol_len, _ = (
+                self._entry(count - 1)
+            )
+            end = self._strings + offset + address_len + name_len
+            if len(self._mm) < end + symbol_len:
+                raise SnapshotError(f"{self.path} is truncated")
+
+    def _entry(self, i: int):
+        return ENTRY.unpack_from(self._mm, HEADER.size + i * ENTRY.size)
+
+    def _address(self, i: int) -> bytes:
+        offset, address_len = self._entry(i)[:2]
+        start = self._strings + offset
+        return self._mm[start:start + address_len]
+
+    def _find(self, address: bytes) -> Optional[int]:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._address(mid) < address:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._address(lo) == address:
+            return lo
+        return None
+
+    def _materialize(self, i: int) -> Token:
+        offset, address_len, name_len, symbol_len, decimals = self._entry(i)
+        start = self._strings + offset
+        name_start = start + address_len
+        symbol_start = name_start + name_len
+        mm = self._mm
+        # Fields were validated when the snapshot was written.
+        return Token.model_construct(
+            address=mm[start:name_start].decode(),
+            name=mm[name_start:symbol_start].decode(),
+            symbol=mm[symbol_start:symbol_start + symbol_len].decode(),
+            decimals=decimals
+        )
+
+    def __getitem__(self, address: str) -> Token:
+        token = self._tokens.get(address)
+        if token is not None:
+            return token
+        i = self._find(address.encode())
+        if i is None:
+            raise KeyError(address)
+        return self._tokens.setdefault(address, self._materialize(i))
+
+    def __contains__(self, address: object) -> bool:
+        if address in self._tokens:
+            return True
+        return (
+            isinstance(address, str)
+            and self._find(address.encode()) is not None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._address(i).decode()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def materialized(self) -> int:
+        return len(self._tokens)
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,299 @@
+import json
+import sqlite3
+import logging
+import threading
+from time import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional
+from src.tokens import Token
+
+
+class TokenStore:
+    """
+    SQLite-backed token storage with indexed lookups by address and
+    symbol. Each write is a single-row upsert, so adding a token never
+    rewrites the rest of the library.
+
+    Mints that could not be resolved are remembered in a separate table
+    with a reason and an expiry, so callers can skip them until the
+    entry lapses instead of querying the APIs again.
+    """
+
+    DEFAULT_FAILURE_TTL = 6 * 60 * 60
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._logger = logging.getLogger(__name__)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tokens (
+                    address TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    decimals INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tokens_symbol "
+                "ON tokens (symbol)"
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS migrations (
+                    name TEXT PRIMARY KEY,
+                    appliedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS failed_mints (
+                    address TEXT PRIMARY KEY,
+                    reason TEXT NOT NULL,
+                    failedAt REAL NOT NULL,
+                    expiresAt REAL NOT NULL
+                )
+                """
+            )
+
+    @staticmethod
+    def _row_to_token(row: sqlite3.Row) -> Token:
+        return Token(
+            address=row["address"],
+            name=row["name"],
+            symbol=row["symbol"],
+            decimals=row["decimals"]
+        )
+
+    def save_token(self, token: Token):
+        self.save_tokens([token])
+
+    def save_tokens(self, tokens: List[Token]):
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO tokens (address, name, symbol, decimals)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(address) DO UPDATE SET
+                    name = excluded.name,
+                    symbol = excluded.symbol,
+                    decimals = excluded.decimals
+                """,
+                [
+                    (t.address, t.name, t.symbol, t.decimals)
+                    for t in tokens
+                ]
+            )
+            conn.executemany(
+                "DELETE FROM failed_mints WHERE address = ?",
+                [(t.address,) for t in tokens]
+            )
+
+    def load_token(self, address: str) -> Optional[Token]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM tokens WHERE address = ?", (address,)
+            ).fetchone()
+        return self._row_to_token(row) if row is not None else None
+
+    def load_tokens_by_symbol(self, symbol: str) -> List[Token]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM tokens WHERE symbol = ? ORDER BY address",
+                (symbol,)
+            ).fetchall()
+        return [self._row_to_token(row) for row in rows]
+
+    def load_all_tokens(self) -> Dict[str, Token]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM tokens").fetchall()
+        return {row["address"]: self._row_to_token(row) for row in rows}
+
+    def token_exists(self, address: str) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM tokens WHERE address = ?", (address,)
+            ).fetchone()
+        return row is not None
+
+    def delete_token(self, address: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM tokens WHERE address = ?", (address,))
+
+    def addresses(self) -> List[str]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT address FROM tokens").fetchall()
+        return [row["address"] for row in rows]
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    def record_failure(
+        self, address: str, reason: str, ttl: Optional[float] = None
+    ):
+        """Remember that `address` could not be resolved for `ttl` secs."""
+        if ttl is None:
+            ttl = self.DEFAULT_FAILURE_TTL
+        now = time()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO failed_mints
+                    (address, reason, failedAt, expiresAt)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(address) DO UPDATE SET
+                    reason = excluded.reason,
+                    failedAt = excluded.failedAt,
+                    expiresAt = excluded.expiresAt
+                """,
+                (address, reason, now, now + ttl)
+            )
+
+    def failure_reason(self, address: str) -> Optional[str]:
+        """Reason `address` is unresolvable, or None if not cached."""
+        return self.failed_mints([address]).get(address)
+
+    def failed_mints(self, addresses: Iterable[str]) -> Dict[str, str]:
+        """Unexpired negative cache entries among `addresses`."""
+        addresses = list(dict.fromkeys(addresses))
+        failures = {}
+        now = time()
+        with self._connect() as conn:
+            # Stay well under SQLITE_MAX_VARIABLE_NUMBER.
+            for i in range(0, len(addresses), 500):
+                chunk = addresses[i:i + 500]
+                rows = conn.execute(
+                    "SELECT address, reason FROM failed_mints "
+                    f"WHERE address IN ({', '.join('?' * len(chunk))}) "
+                    "AND expiresAt > ?",
+                    (*chunk, now)
+                ).fetchall()
+                failures.update(
+                    (row["address"], row["reason"]) for row in rows
+                )
+        return failures
+
+    def clear_failure(self, address: str):
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM failed_mints WHERE address = ?", (address,)
+            )
+
+    def prune_failures(self) -> int:
+        """Delete expired negative cache entries, returning how many."""
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM failed_mints WHERE expiresAt <= ?", (time(),)
+            ).rowcount
+
+    def migrate_json(self, json_path: Path) -> int:
+        """
+        Import a legacy `tokens.json` once. Returns the number of tokens
+        imported, or 0 if the file is missing or was already migrated.
+        """
+        json_path = Path(json_path)
+        migration = f"json:{json_path.resolve()}"
+        with self._connect() as conn:
+            done = conn.execute(
+                "SELECT 1 FROM migrations WHERE name = ?", (migration,)
+            ).fetchone()
+        if done is not None or not json_path.exists():
+            return 0
+
+        try:
+            with open(json_path, "r") as file:
+                tokens = [Token(**entry) for entry in json.load(file)]
+        except Exception as e:
+            raise Exception(f"Error migrating tokens from {json_path}: {e}")
+
+        with self._connect() as conn:
+            # Claiming the migration and importing the tokens happen in one
+            # transaction, so a concurrent import of the same file that
+            # passed the check above finds the row taken and backs off.
+            claimed = conn.execute(
+                "INSERT OR IGNORE INTO migrations (name) VALUES (?)",
+                (migration,)
+            ).rowcount
+            if not claimed:
+                return 0
+            conn.executemany(
+                """
+                INSERT INTO tokens (address, name, symbol, decimals)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(address) DO NOTHING
+                """,
+                [
+                    (t.address, t.name, t.symbol, t.decimals)
+                    for t in tokens
+                ]
+            )
+        self._logger.info(f"Migrated {len(tokens)} tokens from {json_path}")
+        return len(tokens)
+
+
+class TokenCache(MutableMapping):
+    """
+    Dict view over a `TokenStore` that loads tokens on first access.
+
+    Reads fall through to the store on a miss, and assignments are
+    written through immediately, so it can stand in for the plain
+    `tokens` dict.
+    """
+
+    def __init__(self, store: TokenStore):
+        self._store = store
+        self._cache: Dict[str, Token] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, address: str) -> Token:
+        with self._lock:
+            token = self._cache.get(address)
+        if token is not None:
+            return token
+        token = self._store.load_token(address)
+        if token is None:
+            raise KeyError(address)
+        with self._lock:
+            self._cache[address] = token
+        return token
+
+    def __setitem__(self, address: str, token: Token):
+        self._store.save_token(token)
+        with self._lock:
+            self._cache[address] = token
+
+    def __delitem__(self, address: str):
+        if not self._store.token_exists(address):
+            raise KeyError(address)
+        self._store.delete_token(address)
+        with self._lock:
+            self._cache.pop(address, None)
+
+    def __contains__(self, address: object) -> bool:
+        with self._lock:
+            if address in self._cache:
+                return True
+        return isinstance(address, str) and self._store.token_exists(address)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.addresses())
+
+    def __len__(self) -> int:
+        return self._store.count()
+
+    @property
+    def cached(self) -> int:
+        with self._lock:
+            return len(self._cache)
@@ -0,0 +1,170 @@
+import os
+import json
+import atexit
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write `data` via a temp file and rename, never partially."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = 4):
+    atomic_write_bytes(path, json.dumps(data, indent=indent).encode())
+
+
+class WriteBehindWriter:
+    """
+    Collects dirty items and persists them from a background thread.
+
+    `mark_dirty` only records the item and returns; the `flush_func`
+    callback receives every dirty item accumulated since the last flush,
+    either `delay` seconds after the first one arrived or as soon as
+    `max_batch` are pending. A failed flush keeps its items dirty and the
+    worker retries them after `delay`, doubling up to `max_retry_delay`
+    while failures continue, however many items are pending. Pending
+    items are flushed on `close()` and at interpreter exit.
+    """
+
+    MIN_RETRY_DELAY = 0.1
+
+    def __init__(
+        self,
+        flush_func: Callable[[Dict[Hashable, Any]], None],
+        delay: float = 1.0,
+        max_batch: int = 100,
+        name: str = "write-behind",
+        max_retry_delay: float = 60.0
+    ):
+        if delay < 0 or max_batch < 1:
+            raise ValueError("Invalid write-behind settings")
+        self._flush_func = flush_func
+        self.delay = delay
+        self.max_batch = max_batch
+        self.name = name
+        self.max_retry_delay = max_retry_delay
+        self._dirty: Dict[Hashable, Any] = {}
+        self._first_dirty_at: Optional[float] = None
+        self._retry_at: Optional[float] = None
+        self._failures = 0
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+        self.flushes = 0
+        self.items_written = 0
+        self.errors = 0
+        self._logger = logging.getLogger(__name__)
+
+    def _ensure_worker(self):
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._worker.start()
+            atexit.register(self.close)
+
+    def mark_dirty(self, key: Hashable, item: Any):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"{self.name} writer is closed")
+            self._dirty[key] = item
+            if self._first_dirty_at is None:
+                self._first_dirty_at = monotonic()
+            self._ensure_worker()
+            if len(self._dirty) in (1, self.max_batch):
+                self._condition.notify()
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._dirty)
+
+    def _due_in(self) -> Optional[float]:
+        if not self._dirty:
+            return None
+        if self._retry_at is not None:
+            return max(self._retry_at - monotonic(), 0.0)
+        if len(self._dirty) >= self.max_batch:
+            return 0.0
+        return max(self._first_dirty_at + self.delay - monotonic(), 0.0)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    due_in = self._due_in()
+                    if due_in == 0.0:
+                        break
+                    self._condition.wait(due_in)
+                if self._closed:
+                    return
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all dirty items now on the calling thread."""
+        with self._flush_lock:
+            with self._condition:
+                batch = self._dirty
+                self._dirty = {}
+                self._first_dirty_at = None
+            if not batch:
+                return 0
+            try:
+                self._flush_func(batch)
+            except Exception as e:
+                self.errors += 1
+                self._failures += 1
+                retry_in = min(
+                    max(self.delay, self.MIN_RETRY_DELAY)
+                    * 2 ** (self._failures - 1),
+                    self.max_retry_delay
+                )
+                self._logger.error(
+                    f"{self.name} flush failed, retrying in "
+                    f"{retry_in:.1f}s: {e}"
+                )
+                with self._condition:
+                    for key, item in batch.items():
+                        self._dirty.setdefault(key, item)
+                    if self._first_dirty_at is None:
+                        self._first_dirty_at = monotonic()
+                    self._retry_at = monotonic() + retry_in
+                return 0
+            with self._condition:
+                self._retry_at = None
+            self._failures = 0
+            self.flushes += 1
+            self.items_written += len(batch)
+            return len(batch)
+
+    def close(self):
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+        self.flush()
+        atexit.unregister(self.close)
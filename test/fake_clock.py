@@ -0,0 +1,24 @@
+import importlib
+
+
+class FakeClock:
+    """Stands in for a module's `monotonic` and `sleep` in tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+def install_fake_clock(monkeypatch, module):
+    """Patch `module`'s `monotonic`, and `sleep` if it imports one."""
+    clock = FakeClock()
+    monkeypatch.setattr(f"{module}.monotonic", clock.monotonic)
+    if hasattr(importlib.import_module(module), "sleep"):
+        monkeypatch.setattr(f"{module}.sleep", clock.sleep)
+    return clock
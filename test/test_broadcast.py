@@ -0,0 +1,189 @@
+import time
+import pytest
+import threading
+from unittest.mock import MagicMock
+from src.broadcast import (
+    BroadcastError,
+    EndpointBusyError,
+    TransactionBroadcaster
+)
+
+
+class HungRPCClient:
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def send_raw_transaction(self, txn, opts=None):
+        self.calls += 1
+        self.release.wait(timeout=10)
+        raise ConnectionError("gave up")
+
+
+class FakeRPCClient:
+    def __init__(self, delay=0.0, error=None):
+        self.delay = delay
+        self.error = error
+        self.received = []
+        self.done = threading.Event()
+
+    def send_raw_transaction(self, txn, opts=None):
+        try:
+            self.received.append((txn, opts))
+            time.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            return MagicMock(value="tx_signature")
+        finally:
+            self.done.set()
+
+
+@pytest.fixture
+def make_broadcaster():
+    broadcasters = []
+
+    def make(clients, **kwargs):
+        broadcaster = TransactionBroadcaster(clients, **kwargs)
+        broadcasters.append(broadcaster)
+        return broadcaster
+
+    yield make
+    for broadcaster in broadcasters:
+        broadcaster.shutdown()
+
+
+class TestTransactionBroadcaster:
+    def test_requires_clients(self):
+        with pytest.raises(ValueError):
+            TransactionBroadcaster({})
+
+    def test_sends_same_bytes_to_every_endpoint(self, make_broadcaster):
+        clients = {"a": FakeRPCClient(), "b": FakeRPCClient()}
+        broadcaster = make_broadcaster(clients)
+
+        broadcaster.broadcast(b"signed_tx", opts="opts")
+        for client in clients.values():
+            assert client.done.wait(timeout=5)
+            assert client.received == [(b"signed_tx", "opts")]
+
+    def test_returns_first_accepted_signature(self, make_broadcaster):
+        clients = {
+            "slow": FakeRPCClient(delay=0.5),
+            "fast": FakeRPCClient(delay=0.01)
+        }
+        broadcaster = make_broadcaster(clients)
+
+        start = time.monotonic()
+        result = broadcaster.broadcast(b"signed_tx")
+        elapsed = time.monotonic() - start
+
+        assert result.signature == "tx_signature"
+        assert result.endpoint == "fast"
+        assert result.latency < 0.5
+        assert elapsed < 0.5
+
+    def test_failed_endpoint_does_not_win(self, make_broadcaster):
+        clients = {
+            "broken": FakeRPCClient(error=ConnectionError("refused")),
+            "ok": FakeRPCClient(delay=0.05)
+        }
+        broadcaster = make_broadcaster(clients)
+
+        result = broadcaster.broadcast(b"signed_tx")
+
+        assert result.endpoint == "ok"
+        stats = broadcaster.stats()
+        assert stats["broken"].failures == 1
+        assert stats["broken"].errors == {"ConnectionError": 1}
+
+    def test_all_endpoints_fail(self, make_broadcaster):
+        clients = {
+            "a": FakeRPCClient(error=ConnectionError("refused")),
+            "b": FakeRPCClient(error=ValueError("blockhash not found"))
+        }
+        broadcaster = make_broadcaster(clients)
+
+        with pytest.raises(BroadcastError) as exc_info:
+            broadcaster.broadcast(b"signed_tx")
+
+        assert set(exc_info.value.errors) == {"a", "b"}
+        assert "blockhash not found" in str(exc_info.value)
+
+    def test_timeout(self, make_broadcaster):
+        clients = {"stuck": FakeRPCClient(delay=1.0)}
+        broadcaster = make_broadcaster(clients, timeout=0.05)
+
+        with pytest.raises(BroadcastError) as exc_info:
+            broadcaster.broadcast(b"signed_tx")
+
+        assert isinstance(exc_info.value.errors["stuck"], TimeoutError)
+
+    def test_records_wins_and_latency(self, make_broadcaster):
+        clients = {
+            "slow": FakeRPCClient(delay=0.2),
+            "fast": FakeRPCClient(delay=0.01)
+        }
+        broadcaster = make_broadcaster(clients)
+
+        for _ in range(2):
+            broadcaster.broadcast(b"signed_tx")
+        clients["slow"].done.wait(timeout=5)
+        time.sleep(0.3)
+
+        stats = broadcaster.stats()
+        assert stats["fast"].wins == 2
+        assert stats["slow"].wins == 0
+        assert stats["fast"].sends == stats["slow"].sends == 2
+        assert stats["slow"].accepted == 2
+        assert stats["fast"].mean_win_latency < stats["slow"].mean_latency
+        assert stats["slow"].mean_win_latency is None
+
+    def test_hung_endpoint_does_not_starve_others(self, make_broadcaster):
+        clients = {"hung": HungRPCClient(), "healthy": FakeRPCClient()}
+        broadcaster = make_broadcaster(
+            clients, timeout=1.0, max_in_flight=2
+        )
+        try:
+            for _ in range(10):
+                result = broadcaster.broadcast(b"signed_tx")
+                assert result.endpoint == "healthy"
+        finally:
+            clients["hung"].release.set()
+
+        stats = broadcaster.stats()
+        assert clients["hung"].calls == 2
+        assert stats["hung"].sends == 2
+        assert stats["hung"].skipped == 8
+        assert stats["healthy"].sends == 10
+
+    def test_busy_endpoints_reported(self, make_broadcaster):
+        clients = {"hung": HungRPCClient()}
+        broadcaster = make_broadcaster(
+            clients, timeout=0.05, max_in_flight=1
+        )
+        try:
+            with pytest.raises(BroadcastError):
+                broadcaster.broadcast(b"signed_tx")
+            with pytest.raises(BroadcastError) as exc_info:
+                broadcaster.broadcast(b"signed_tx")
+        finally:
+            clients["hung"].release.set()
+
+        assert isinstance(exc_info.value.errors["hung"], EndpointBusyError)
+
+    def test_endpoint_available_again_after_sends_finish(
+        self, make_broadcaster
+    ):
+        clients = {"hung": HungRPCClient(), "healthy": FakeRPCClient()}
+        broadcaster = make_broadcaster(clients, max_in_flight=1)
+        broadcaster.broadcast(b"signed_tx")
+        clients["hung"].release.set()
+        deadline = time.monotonic() + 5
+        while (
+            broadcaster._outstanding["hung"]
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+
+        broadcaster.broadcast(b"signed_tx")
+        assert clients["hung"].calls == 2
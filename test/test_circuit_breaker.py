@@ -0,0 +1,331 @@
+import pytest
+import threading
+from unittest.mock import MagicMock
+from src.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+    RetryBudget,
+    call_with_breaker,
+    decorrelated_jitter
+)
+from fake_clock import install_fake_clock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return install_fake_clock(monkeypatch, "src.circuit_breaker")
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        "api.jup.ag", failure_threshold=3, recovery_timeout=10
+    )
+
+
+def failing():
+    raise ConnectionError("Jupiter degraded")
+
+
+class TestDecorrelatedJitter:
+    def test_range(self):
+        for previous in (0.5, 1.0, 4.0):
+            for _ in range(100):
+                delay = decorrelated_jitter(previous, base=0.5, cap=30)
+                assert 0.5 <= delay <= max(0.5, previous * 3)
+
+    def test_capped(self):
+        assert decorrelated_jitter(100, base=1, cap=5, rng=max) == 5
+
+    def test_uses_previous_delay(self):
+        assert decorrelated_jitter(2, base=0.5, rng=max) == 6
+
+
+class TestCircuitBreaker:
+    def test_starts_closed(self, breaker):
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker("x", failure_threshold=0)
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                breaker.call(failing)
+        assert breaker.state is CircuitState.OPEN
+
+    def test_success_resets_failure_count(self, breaker):
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call(failing)
+        breaker.call(lambda: None)
+        with pytest.raises(ConnectionError):
+            breaker.call(failing)
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_open_circuit_fails_fast(self, breaker):
+        for _ in range(3):
+            breaker.record_failure()
+        func = MagicMock()
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.call(func)
+
+        func.assert_not_called()
+        assert exc_info.value.retry_in == pytest.approx(10)
+        assert breaker.snapshot().rejected == 1
+
+    def test_half_open_after_recovery_timeout(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        assert breaker.state is CircuitState.HALF_OPEN
+
+    def test_half_open_success_closes(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        with pytest.raises(ConnectionError):
+            breaker.call(failing)
+        assert breaker.state is CircuitState.OPEN
+
+    def test_half_open_limits_trial_calls(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_interrupted_trial_frees_slot(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+
+        def interrupted():
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            breaker.call(interrupted)
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_lost_trial_readmitted_after_recovery_timeout(
+        self, breaker, clock
+    ):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        clock.now += 10
+        probe = breaker.before_call()
+        breaker.record_success(probe)
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_straggler_success_does_not_close_open_circuit(self, breaker):
+        generation = breaker.before_call()
+        for _ in range(3):
+            breaker.record_failure()
+
+        breaker.record_success(generation)
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.snapshot().total_successes == 1
+
+    def test_success_while_open_does_not_close(self, breaker):
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state is CircuitState.OPEN
+
+    def test_straggler_failure_does_not_extend_open_window(
+        self, breaker, clock
+    ):
+        generation = breaker.before_call()
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 5
+        breaker.record_failure(generation)
+
+        assert breaker.snapshot().opened_at == 1000.0
+        clock.now += 5
+        assert breaker.state is CircuitState.HALF_OPEN
+
+    def test_straggler_does_not_settle_half_open_probe(
+        self, breaker, clock
+    ):
+        generation = breaker.before_call()
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        probe = breaker.before_call()
+
+        breaker.record_success(generation)
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.record_failure(generation)
+        assert breaker.state is CircuitState.HALF_OPEN
+
+        breaker.record_success(probe)
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_slow_call_admitted_while_closed(self, breaker, clock):
+        def slow_success():
+            for _ in range(3):
+                breaker.record_failure()
+            return "late"
+
+        assert breaker.call(slow_success) == "late"
+        assert breaker.state is CircuitState.OPEN
+
+    def test_snapshot(self, breaker):
+        breaker.call(lambda: None)
+        breaker.record_failure()
+        snapshot = breaker.snapshot()
+        assert snapshot.name == "api.jup.ag"
+        assert snapshot.state is CircuitState.CLOSED
+        assert snapshot.total_successes == 1
+        assert snapshot.total_failures == 1
+        assert snapshot.consecutive_failures == 1
+
+
+class TestRetryBudget:
+    def test_min_retries_always_allowed(self, clock):
+        budget = RetryBudget(ratio=0.1, min_retries=2)
+        assert budget.try_acquire_retry()
+        assert budget.try_acquire_retry()
+        assert not budget.try_acquire_retry()
+
+    def test_ratio_of_requests(self, clock):
+        budget = RetryBudget(ratio=0.5, min_retries=0)
+        for _ in range(4):
+            budget.record_request()
+        assert budget.try_acquire_retry()
+        assert budget.try_acquire_retry()
+        assert not budget.try_acquire_retry()
+        assert budget.usage() == (4, 2)
+
+    def test_window_expires_events(self, clock):
+        budget = RetryBudget(ratio=0, window=10, min_retries=1)
+        assert budget.try_acquire_retry()
+        assert not budget.try_acquire_retry()
+        clock.now += 10
+        assert budget.try_acquire_retry()
+
+
+class TestCircuitBreakerRegistry:
+    def test_shared_registry_is_singleton(self, monkeypatch):
+        monkeypatch.setattr(CircuitBreakerRegistry, "_shared", None)
+        registry_1 = CircuitBreakerRegistry.get_shared()
+        registry_2 = CircuitBreakerRegistry.get_shared()
+        assert registry_1 is registry_2
+
+    def test_one_breaker_per_endpoint(self, clock):
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        assert registry.get("a") is registry.get("a")
+        assert registry.get("a") is not registry.get("b")
+        assert registry.get("a").failure_threshold == 2
+
+    def test_thread_safety(self):
+        registry = CircuitBreakerRegistry()
+        breakers = []
+
+        def get_breaker():
+            breakers.append(registry.get("api.jup.ag"))
+
+        threads = [threading.Thread(target=get_breaker) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(breaker is breakers[0] for breaker in breakers)
+
+    def test_snapshot_is_inspectable(self, clock):
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.get("api.jup.ag").record_failure()
+        registry.get("api.dexscreener.com")
+        states = {
+            name: snapshot.state
+            for name, snapshot in registry.snapshot().items()
+        }
+        assert states == {
+            "api.jup.ag": CircuitState.OPEN,
+            "api.dexscreener.com": CircuitState.CLOSED
+        }
+
+
+class TestCallWithBreaker:
+    @pytest.fixture
+    def registry(self, clock):
+        return CircuitBreakerRegistry(
+            retry_budget=RetryBudget(ratio=1, min_retries=10),
+            failure_threshold=5
+        )
+
+    def test_success(self, registry):
+        assert call_with_breaker(
+            "api.jup.ag", lambda x: x * 2, 21, registry=registry
+        ) == 42
+
+    def test_retries_then_succeeds(self, registry, clock):
+        func = MagicMock(side_effect=[ConnectionError(), "ok"])
+        result = call_with_breaker(
+            "api.jup.ag", func, registry=registry, max_retries=3
+        )
+        assert result == "ok"
+        assert func.call_count == 2
+        assert len(clock.sleeps) == 1
+
+    def test_gives_up_after_max_retries(self, registry, clock):
+        func = MagicMock(side_effect=ConnectionError("down"))
+        with pytest.raises(ConnectionError):
+            call_with_breaker(
+                "api.jup.ag", func, registry=registry, max_retries=2
+            )
+        assert func.call_count == 3
+
+    def test_does_not_retry_unlisted_errors(self, registry):
+        func = MagicMock(side_effect=ValueError("bad request"))
+        with pytest.raises(ValueError):
+            call_with_breaker(
+                "api.jup.ag",
+                func,
+                registry=registry,
+                retry_on=(ConnectionError,)
+            )
+        assert func.call_count == 1
+
+    def test_fails_fast_when_open(self, registry, clock):
+        func = MagicMock(side_effect=ConnectionError("down"))
+        with pytest.raises(CircuitOpenError):
+            call_with_breaker(
+                "api.jup.ag", func, registry=registry, max_retries=10
+            )
+        assert func.call_count == 5
+
+    def test_respects_retry_budget(self, clock):
+        registry = CircuitBreakerRegistry(
+            retry_budget=RetryBudget(ratio=0, min_retries=1),
+            failure_threshold=100
+        )
+        func = MagicMock(side_effect=ConnectionError("down"))
+        with pytest.raises(ConnectionError):
+            call_with_breaker(
+                "api.jup.ag", func, registry=registry, max_retries=10
+            )
+        assert func.call_count == 2
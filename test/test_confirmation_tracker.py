@@ -0,0 +1,279 @@
+import time
+import pytest
+import threading
+from unittest.mock import MagicMock
+from src.confirmation_tracker import (
+    ConfirmationTracker,
+    SignatureStatus,
+    MAX_SIGNATURES_PER_REQUEST
+)
+from fake_clock import install_fake_clock
+
+
+class FakeStatus:
+    def __init__(self, confirmation_status=None, err=None):
+        self.confirmation_status = confirmation_status
+        self.err = err
+
+
+class FakeRPCClient:
+    def __init__(self):
+        self.statuses = {}
+        self.requests = []
+
+    def get_signature_statuses(self, signatures):
+        self.requests.append(list(signatures))
+        return MagicMock(value=[self.statuses.get(s) for s in signatures])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return install_fake_clock(monkeypatch, "src.confirmation_tracker")
+
+
+@pytest.fixture
+def rpc_client():
+    return FakeRPCClient()
+
+
+@pytest.fixture
+def tracker(rpc_client, clock):
+    return ConfirmationTracker(
+        rpc_client, expiry=60, min_interval=0.5, max_interval=4
+    )
+
+
+class TestConfirmationTracker:
+    def test_invalid_commitment(self, rpc_client):
+        with pytest.raises(ValueError):
+            ConfirmationTracker(rpc_client, commitment="eventually")
+
+    def test_track_marks_pending(self, tracker):
+        tracker.track("sig1")
+        assert tracker.status("sig1") is SignatureStatus.PENDING
+        assert tracker.status("unknown") is None
+
+    def test_no_rpc_call_when_nothing_pending(self, tracker, rpc_client):
+        assert tracker.poll_once() == 0
+        assert rpc_client.requests == []
+
+    def test_confirmed_fires_callback(self, tracker, rpc_client):
+        notifications = []
+        tracker.confirmed.register("sig1", lambda: notifications.append(1))
+        tracker.track("sig1")
+        rpc_client.statuses["sig1"] = FakeStatus(
+            "TransactionConfirmationStatus.Confirmed"
+        )
+
+        tracker.poll_once()
+
+        assert notifications == [1]
+        assert tracker.status("sig1") is SignatureStatus.CONFIRMED
+        assert tracker.pending_count == 0
+
+    def test_settled_signature_unregisters_observers(
+        self, tracker, rpc_client
+    ):
+        dispatchers = (tracker.confirmed, tracker.failed, tracker.expired)
+        for dispatcher in dispatchers:
+            dispatcher.register("sig1", lambda: None)
+            dispatcher.register("sig2", lambda: None)
+        tracker.track("sig1")
+        tracker.track("sig2")
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed")
+        rpc_client.statuses["sig2"] = FakeStatus("confirmed", err="err")
+
+        tracker.poll_once()
+
+        assert all(not dispatcher._observers for dispatcher in dispatchers)
+
+    def test_processed_is_not_confirmed(self, tracker, rpc_client):
+        tracker.track("sig1")
+        rpc_client.statuses["sig1"] = FakeStatus("processed")
+        tracker.poll_once()
+        assert tracker.status("sig1") is SignatureStatus.PENDING
+
+    def test_finalized_commitment(self, rpc_client, clock):
+        tracker = ConfirmationTracker(rpc_client, commitment="finalized")
+        tracker.track("sig1")
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed")
+        tracker.poll_once()
+        assert tracker.status("sig1") is SignatureStatus.PENDING
+
+        rpc_client.statuses["sig1"] = FakeStatus("finalized")
+        tracker.poll_once()
+        assert tracker.status("sig1") is SignatureStatus.CONFIRMED
+
+    def test_failed_fires_callback(self, tracker, rpc_client):
+        notifications = []
+        tracker.failed.register("sig1", lambda: notifications.append(1))
+        tracker.track("sig1")
+        rpc_client.statuses["sig1"] = FakeStatus(
+            "confirmed", err="InstructionError"
+        )
+
+        tracker.poll_once()
+
+        assert notifications == [1]
+        assert tracker.status("sig1") is SignatureStatus.FAILED
+        assert tracker.error("sig1") == "InstructionError"
+
+    def test_expired_fires_callback(self, tracker, clock):
+        notifications = []
+        tracker.expired.register("sig1", lambda: notifications.append(1))
+        tracker.track("sig1")
+        tracker.poll_once()
+        assert notifications == []
+
+        clock.now += 60
+        tracker.poll_once()
+
+        assert notifications == [1]
+        assert tracker.status("sig1") is SignatureStatus.EXPIRED
+
+    def test_landed_signature_is_not_expired(self, rpc_client, clock):
+        tracker = ConfirmationTracker(
+            rpc_client, commitment="finalized", expiry=90
+        )
+        expired = []
+        tracker.track("sig1", on_expired=lambda: expired.append(1))
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed")
+
+        clock.now += 120
+        tracker.poll_once()
+
+        assert expired == []
+        assert tracker.status("sig1") is SignatureStatus.PENDING
+
+        rpc_client.statuses["sig1"] = FakeStatus("finalized")
+        tracker.poll_once()
+        assert tracker.status("sig1") is SignatureStatus.CONFIRMED
+
+    def test_track_registers_observers(self, tracker, rpc_client):
+        notifications = []
+        tracker.track(
+            "sig1",
+            on_confirmed=lambda: notifications.append("confirmed"),
+            on_failed=lambda: notifications.append("failed"),
+            on_expired=lambda: notifications.append("expired")
+        )
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed")
+
+        tracker.poll_once()
+
+        assert notifications == ["confirmed"]
+        assert not tracker.confirmed._observers
+        assert not tracker.failed._observers
+        assert not tracker.expired._observers
+
+    def test_track_settled_signature_fires_immediately(
+        self, tracker, rpc_client
+    ):
+        tracker.track("sig1")
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed", err="err")
+        tracker.poll_once()
+        notifications = []
+
+        tracker.track(
+            "sig1",
+            on_confirmed=lambda: notifications.append("confirmed"),
+            on_failed=lambda: notifications.append("failed")
+        )
+
+        assert notifications == ["failed"]
+        assert not tracker.confirmed._observers
+        assert not tracker.failed._observers
+        assert tracker.pending_count == 0
+
+    def test_batches_up_to_256_signatures(self, tracker, rpc_client):
+        for i in range(600):
+            tracker.track(f"sig{i}")
+
+        assert tracker.poll_once() == 3
+        assert [len(r) for r in rpc_client.requests] == [
+            MAX_SIGNATURES_PER_REQUEST, MAX_SIGNATURES_PER_REQUEST, 88
+        ]
+
+    def test_settled_signatures_are_not_polled_again(
+        self, tracker, rpc_client
+    ):
+        tracker.track("sig1")
+        tracker.track("sig2")
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed")
+        tracker.poll_once()
+        tracker.poll_once()
+        assert rpc_client.requests[-1] == ["sig2"]
+
+    def test_track_ignores_duplicates(self, tracker, rpc_client):
+        tracker.track("sig1")
+        tracker.track("sig1")
+        tracker.poll_once()
+        assert rpc_client.requests == [["sig1"]]
+
+    def test_adaptive_interval(self, tracker, rpc_client):
+        tracker.track("sig1")
+        tracker.track("sig2")
+        tracker.poll_once()
+        tracker.poll_once()
+        assert tracker.interval == pytest.approx(0.5 * 1.5 ** 2)
+
+        for _ in range(10):
+            tracker.poll_once()
+        assert tracker.interval == 4
+
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed")
+        tracker.poll_once()
+        assert tracker.interval == 0.5
+
+    def test_rpc_error_keeps_signatures_pending(self, tracker, rpc_client):
+        rpc_client.get_signature_statuses = MagicMock(
+            side_effect=ConnectionError("rpc down")
+        )
+        tracker.track("sig1")
+        assert tracker.poll_once() == 0
+        assert tracker.status("sig1") is SignatureStatus.PENDING
+
+    def test_failing_observer_does_not_stop_tracking(
+        self, tracker, rpc_client
+    ):
+        def failing_observer():
+            raise ValueError("Intentional observer failure")
+
+        tracker.confirmed.register("sig1", failing_observer)
+        tracker.track("sig1")
+        tracker.track("sig2")
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed")
+        rpc_client.statuses["sig2"] = FakeStatus("confirmed")
+
+        tracker.poll_once()
+
+        assert tracker.status("sig2") is SignatureStatus.CONFIRMED
+
+    def test_background_worker(self, rpc_client):
+        tracker = ConfirmationTracker(rpc_client, min_interval=0.01)
+        confirmed = threading.Event()
+        tracker.confirmed.register("sig1", confirmed.set)
+        rpc_client.statuses["sig1"] = FakeStatus("confirmed")
+
+        tracker.start()
+        try:
+            tracker.track("sig1")
+            assert confirmed.wait(timeout=5)
+        finally:
+            tracker.stop()
+
+    def test_track_while_busy_waits_for_scheduled_poll(self, rpc_client):
+        tracker = ConfirmationTracker(
+            rpc_client, min_interval=0.1, max_interval=0.1
+        )
+        tracker.start()
+        try:
+            start = time.monotonic()
+            for i in range(200):
+                tracker.track(f"sig{i}")
+                time.sleep(0.0025)
+            elapsed = time.monotonic() - start
+        finally:
+            tracker.stop()
+
+        assert len(rpc_client.requests) <= elapsed / 0.1 + 2
@@ -0,0 +1,174 @@
+import json
+import time
+import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.tokens import Token
+from src.http_session import HTTPSessionPool
+from src.dexscreener_batch import (
+    MAX_TOKENS_PER_REQUEST,
+    DEXScreenerBatchClient,
+    resolve_tokens
+)
+
+
+def pair(base, quote="USDC"):
+    return {
+        "chainId": "solana",
+        "baseToken": {
+            "address": base, "name": f"Token {base}", "symbol": base
+        },
+        "quoteToken": {
+            "address": quote, "name": f"Token {quote}", "symbol": quote
+        }
+    }
+
+
+class StandInDEXScreener:
+    def __init__(self):
+        self.requests = []
+        self.unlisted = set()
+        self.fail = False
+        self.delay = 0.05
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def handle(self, addresses):
+        with self.lock:
+            self.requests.append(addresses)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if self.fail or len(addresses) > MAX_TOKENS_PER_REQUEST:
+                return 400, {"error": "Bad request"}
+            return 200, [
+                pair(address) for address in addresses
+                if address not in self.unlisted
+            ]
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def stand_in():
+    dexscreener = StandInDEXScreener()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            addresses = self.path.rsplit("/", 1)[-1].split(",")
+            status, reply = dexscreener.handle(addresses)
+            body = json.dumps(reply).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    dexscreener.url = (
+        f"http://127.0.0.1:{server.server_address[1]}/tokens/v1/solana"
+    )
+    yield dexscreener
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stand_in):
+    pool = HTTPSessionPool()
+    yield DEXScreenerBatchClient(
+        session_pool=pool, concurrency=4, base_url=stand_in.url
+    )
+    pool.close()
+
+
+class FakeRPCClient:
+    def __init__(self, decimals):
+        self.decimals = decimals
+        self.requests = []
+
+    def get_mint_decimals(self, mints):
+        self.requests.append(list(mints))
+        return {mint: self.decimals.get(mint) for mint in mints}
+
+
+class TestDEXScreenerBatchClient:
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            DEXScreenerBatchClient(concurrency=0)
+
+    def test_resolves_names_and_symbols(self, client):
+        assert client.get_tokens_info(["BONK", "WIF"]) == {
+            "BONK": {"name": "Token BONK", "symbol": "BONK"},
+            "WIF": {"name": "Token WIF", "symbol": "WIF"}
+        }
+
+    def test_quote_token_matches(self, client):
+        assert client.get_tokens_info(["USDC"]) == {
+            "USDC": {"name": "Token USDC", "symbol": "USDC"}
+        }
+
+    def test_unlisted_mint_is_none(self, client, stand_in):
+        stand_in.unlisted.add("SPAM")
+        assert client.get_tokens_info(["SPAM"]) == {"SPAM": None}
+
+    def test_200_tokens_in_a_handful_of_requests(self, client, stand_in):
+        addresses = [f"mint{i}" for i in range(200)]
+        info = client.get_tokens_info(addresses + addresses[:10])
+
+        assert len(stand_in.requests) == 7
+        assert all(
+            len(chunk) <= MAX_TOKENS_PER_REQUEST
+            for chunk in stand_in.requests
+        )
+        assert sorted(sum(stand_in.requests, [])) == sorted(addresses)
+        assert all(info[address] for address in addresses)
+
+    def test_chunks_fetched_concurrently(self, client, stand_in):
+        client.get_tokens_info([f"mint{i}" for i in range(120)])
+        assert stand_in.max_in_flight > 1
+        assert stand_in.max_in_flight <= 4
+
+    def test_http_error_raises(self, client, stand_in):
+        stand_in.fail = True
+        with pytest.raises(Exception):
+            client.get_tokens_info(["BONK"])
+
+    def test_empty(self, client, stand_in):
+        assert client.get_tokens_info([]) == {}
+        assert stand_in.requests == []
+
+
+class TestResolveTokens:
+    def test_resolves_tokens_and_reports_failures(self, client, stand_in):
+        stand_in.unlisted.add("SPAM")
+        rpc_client = FakeRPCClient({"BONK": 5, "WIF": 6})
+
+        tokens, failures = resolve_tokens(
+            ["BONK", "WIF", "SPAM", "CLOSED"], rpc_client, client
+        )
+
+        assert tokens == {
+            "BONK": Token(
+                address="BONK", name="Token BONK", symbol="BONK",
+                decimals=5
+            ),
+            "WIF": Token(
+                address="WIF", name="Token WIF", symbol="WIF", decimals=6
+            )
+        }
+        assert failures == {
+            "SPAM": "no DEXScreener pairs",
+            "CLOSED": "mint decimals unavailable"
+        }
+        assert rpc_client.requests == [["BONK", "WIF", "CLOSED"]]
@@ -0,0 +1,141 @@
+import json
+import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.http_session import HTTPSessionPool
+from src.rate_limiter import RateLimiter
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/limited":
+            self.send_response(429)
+            self.send_header("Retry-After", "7")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._reply({"path": self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(json.loads(self.rfile.read(length)))
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session_pool():
+    pool = HTTPSessionPool(pool_connections=2, pool_maxsize=4)
+    yield pool
+    pool.close()
+
+
+class TestHTTPSessionPool:
+    def test_shared_pool_is_singleton(self, monkeypatch):
+        monkeypatch.setattr(HTTPSessionPool, "_shared", None)
+        assert HTTPSessionPool.get_shared() is HTTPSessionPool.get_shared()
+
+    def test_shared_pool_thread_safety(self, monkeypatch):
+        monkeypatch.setattr(HTTPSessionPool, "_shared", None)
+        instances = []
+
+        def get_instance():
+            instances.append(HTTPSessionPool.get_shared())
+
+        threads = [threading.Thread(target=get_instance) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(instance is instances[0] for instance in instances)
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError):
+            HTTPSessionPool(pool_maxsize=0)
+
+    def test_invalid_url(self, session_pool):
+        with pytest.raises(ValueError):
+            session_pool.session("not a url")
+
+    def test_session_is_reused_per_host(self, session_pool):
+        session_1 = session_pool.session("https://api.jup.ag/limit/v2/a")
+        session_2 = session_pool.session("https://api.jup.ag/limit/v2/b")
+        session_3 = session_pool.session("https://api.dexscreener.com/x")
+        assert session_1 is session_2
+        assert session_1 is not session_3
+
+    def test_adapter_uses_configured_pool_size(self, session_pool):
+        session = session_pool.session("https://api.jup.ag/")
+        adapter = session.get_adapter("https://api.jup.ag/")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 0
+
+    def test_keep_alive_reuses_connection(self, session_pool, local_server):
+        for i in range(5):
+            response = session_pool.get(f"{local_server}/tokens/{i}")
+            assert response.json() == {"path": f"/tokens/{i}"}
+
+        stats = session_pool.stats()[local_server]
+        assert stats.requests == 5
+        assert stats.misses == 1
+        assert stats.hits == 4
+
+    def test_post_passes_json(self, session_pool, local_server):
+        response = session_pool.post(
+            f"{local_server}/createOrder", json={"inputMint": "A"}
+        )
+        assert response.json() == {"inputMint": "A"}
+
+    def test_close_drops_sessions(self, session_pool, local_server):
+        session_pool.get(local_server)
+        session_pool.close()
+        assert session_pool.stats() == {}
+
+    def test_acquires_rate_limit_per_host(self, local_server):
+        limiter = RateLimiter(budgets={}, default_budget=(1000, 1000))
+        pool = HTTPSessionPool(rate_limiter=limiter)
+        try:
+            pool.get(f"{local_server}/a")
+            pool.get(f"{local_server}/b")
+        finally:
+            pool.close()
+
+        assert limiter.stats()["127.0.0.1"].acquired == 2
+
+    def test_429_honours_retry_after(self, local_server, monkeypatch):
+        limiter = RateLimiter(budgets={}, default_budget=(1000, 1000))
+        pool = HTTPSessionPool(rate_limiter=limiter)
+        try:
+            response = pool.get(f"{local_server}/limited")
+        finally:
+            pool.close()
+
+        assert response.status_code == 429
+        sleeps = []
+        monkeypatch.setattr("src.rate_limiter.sleep", sleeps.append)
+        limiter.acquire("127.0.0.1")
+        assert sleeps and 6 < sleeps[0] <= 7
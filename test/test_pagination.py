@@ -0,0 +1,135 @@
+import asyncio
+import pytest
+from src.pagination import fetch_all_pages, has_more_data
+from mock_api_responses import (
+    MOCK_GET_ORDER_HISTORY_PAGE_1,
+    MOCK_GET_ORDER_HISTORY_PAGE_2
+)
+
+
+class FakeHistory:
+    def __init__(self, total_pages, delay=0.01, fail_on=None):
+        self.total_pages = total_pages
+        self.delay = delay
+        self.fail_on = fail_on
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, page):
+        self.requested.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if page == self.fail_on:
+                raise RuntimeError(f"page {page} failed")
+            await asyncio.sleep(self.delay)
+            if page > self.total_pages:
+                return {"orders": [], "hasMoreData": "false", "page": page}
+            return {
+                "orders": [{"orderKey": f"order_{page}"}],
+                "hasMoreData": (
+                    "true" if page < self.total_pages else "false"
+                ),
+                "page": page
+            }
+        finally:
+            self.in_flight -= 1
+
+
+class TestHasMoreData:
+    def test_string_values(self):
+        assert has_more_data(MOCK_GET_ORDER_HISTORY_PAGE_1) is True
+        assert has_more_data(MOCK_GET_ORDER_HISTORY_PAGE_2) is False
+
+    def test_bool_values(self):
+        assert has_more_data({"hasMoreData": True}) is True
+        assert has_more_data({"hasMoreData": False}) is False
+
+    def test_missing_value(self):
+        assert has_more_data({}) is False
+
+
+class TestFetchAllPages:
+    def test_returns_pages_in_order(self):
+        history = FakeHistory(total_pages=10)
+        pages = asyncio.run(fetch_all_pages(history, concurrency=4))
+
+        assert [page["page"] for page in pages] == list(range(1, 11))
+
+    def test_single_page(self):
+        history = FakeHistory(total_pages=1)
+        pages = asyncio.run(fetch_all_pages(history, concurrency=1))
+
+        assert len(pages) == 1
+        assert history.requested == [1]
+
+    def test_respects_concurrency_cap(self):
+        history = FakeHistory(total_pages=20)
+        asyncio.run(fetch_all_pages(history, concurrency=3))
+
+        assert history.max_in_flight == 3
+
+    def test_fetches_pages_concurrently(self):
+        history = FakeHistory(total_pages=40, delay=0.05)
+        loop = asyncio.new_event_loop()
+        try:
+            start = loop.time()
+            pages = loop.run_until_complete(
+                fetch_all_pages(history, concurrency=20)
+            )
+            elapsed = loop.time() - start
+        finally:
+            loop.close()
+
+        assert len(pages) == 40
+        assert elapsed < 40 * 0.05 / 4
+
+    def test_does_not_overshoot_beyond_concurrency(self):
+        history = FakeHistory(total_pages=5)
+        asyncio.run(fetch_all_pages(history, concurrency=4))
+
+        assert max(history.requested) <= 5 + 4
+
+    def test_max_pages(self):
+        history = FakeHistory(total_pages=50)
+        pages = asyncio.run(
+            fetch_all_pages(history, concurrency=4, max_pages=6)
+        )
+
+        assert len(pages) == 6
+        assert max(history.requested) == 6
+
+    def test_first_page(self):
+        history = FakeHistory(total_pages=5)
+        pages = asyncio.run(
+            fetch_all_pages(history, concurrency=2, first_page=3)
+        )
+
+        assert [page["page"] for page in pages] == [3, 4, 5]
+
+    def test_error_propagates(self):
+        history = FakeHistory(total_pages=10, fail_on=3)
+
+        with pytest.raises(RuntimeError, match="page 3 failed"):
+            asyncio.run(fetch_all_pages(history, concurrency=4))
+        assert max(history.requested) < 3 + 4
+
+    def test_error_past_last_page_is_ignored(self):
+        history = FakeHistory(total_pages=3, fail_on=4)
+        pages = asyncio.run(fetch_all_pages(history, concurrency=4))
+
+        assert 4 in history.requested
+        assert [page["page"] for page in pages] == [1, 2, 3]
+
+    def test_error_within_max_pages_propagates(self):
+        history = FakeHistory(total_pages=10, fail_on=2)
+
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            asyncio.run(
+                fetch_all_pages(history, concurrency=4, max_pages=3)
+            )
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            asyncio.run(fetch_all_pages(FakeHistory(1), concurrency=0))
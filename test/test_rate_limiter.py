@@ -0,0 +1,149 @@
+import asyncio
+import pytest
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from src.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+from fake_clock import install_fake_clock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return install_fake_clock(monkeypatch, "src.rate_limiter")
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_negative_seconds_clamped(self):
+        assert parse_retry_after("-2") == 0.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 28 <= delay <= 30
+
+    def test_invalid_or_missing(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestTokenBucket:
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0.5)
+
+    def test_burst_up_to_capacity_does_not_wait(self, clock):
+        bucket = TokenBucket(rate=2, capacity=3)
+        for _ in range(3):
+            assert bucket.acquire() == 0
+        assert clock.sleeps == []
+
+    def test_waits_once_bucket_is_empty(self, clock):
+        bucket = TokenBucket(rate=2, capacity=1)
+        bucket.acquire()
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(1.0)
+        assert clock.sleeps == [pytest.approx(0.5), pytest.approx(1.0)]
+
+    def test_refills_over_time(self, clock):
+        bucket = TokenBucket(rate=2, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 1.0
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+
+    def test_block_for_delays_next_acquire(self, clock):
+        bucket = TokenBucket(rate=10, capacity=10)
+        bucket.block_for(5)
+        assert bucket.acquire() == pytest.approx(5)
+        assert bucket.acquire() == pytest.approx(5.1)
+
+    def test_no_refill_while_blocked(self, clock):
+        bucket = TokenBucket(rate=1, capacity=5)
+        bucket.block_for(3)
+        clock.now += 4
+        bucket.acquire()
+        assert bucket.acquire() == pytest.approx(0)
+        assert bucket.acquire() == pytest.approx(1)
+
+    def test_wait_stats(self, clock):
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+        assert bucket.stats.acquired == 3
+        assert bucket.stats.waited == 2
+        assert bucket.stats.total_wait == pytest.approx(3)
+        assert bucket.stats.max_wait == pytest.approx(2)
+        assert bucket.stats.mean_wait == pytest.approx(1)
+
+    def test_acquire_async(self, clock):
+        bucket = TokenBucket(rate=100, capacity=1)
+
+        async def acquire_twice():
+            return [await bucket.acquire_async() for _ in range(2)]
+
+        assert asyncio.run(acquire_twice()) == [0, pytest.approx(0.01)]
+        assert clock.sleeps == []
+
+    def test_thread_safety(self, clock):
+        bucket = TokenBucket(rate=1, capacity=1)
+        delays = []
+        lock = threading.Lock()
+
+        def acquire():
+            delay = bucket.acquire()
+            with lock:
+                delays.append(delay)
+
+        threads = [threading.Thread(target=acquire) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(delays) == [pytest.approx(i) for i in range(20)]
+
+
+class TestRateLimiter:
+    def test_shared_limiter_is_singleton(self, monkeypatch):
+        monkeypatch.setattr(RateLimiter, "_shared", None)
+        assert RateLimiter.get_shared() is RateLimiter.get_shared()
+
+    def test_per_endpoint_budgets(self, clock):
+        limiter = RateLimiter(
+            budgets={"api.jup.ag": (1, 1)}, default_budget=(5, 5)
+        )
+        assert limiter.bucket("api.jup.ag").rate == 1
+        assert limiter.bucket("api.dexscreener.com").rate == 5
+        assert limiter.bucket("api.jup.ag") is limiter.bucket("api.jup.ag")
+
+    def test_endpoints_are_independent(self, clock):
+        limiter = RateLimiter(budgets={}, default_budget=(1, 1))
+        assert limiter.acquire("a") == 0
+        assert limiter.acquire("b") == 0
+        assert limiter.acquire("a") == pytest.approx(1)
+
+    def test_honour_retry_after(self, clock):
+        limiter = RateLimiter(budgets={}, default_budget=(10, 10))
+        assert limiter.honour_retry_after("api.jup.ag", "2") == 2
+        assert limiter.acquire("api.jup.ag") == pytest.approx(2)
+
+    def test_honour_retry_after_ignores_missing_header(self, clock):
+        limiter = RateLimiter(budgets={}, default_budget=(10, 10))
+        assert limiter.honour_retry_after("api.jup.ag", None) is None
+        assert limiter.acquire("api.jup.ag") == 0
+
+    def test_stats_are_snapshots(self, clock):
+        limiter = RateLimiter(budgets={}, default_budget=(1, 1))
+        limiter.acquire("api.jup.ag")
+        stats = limiter.stats()
+        limiter.acquire("api.jup.ag")
+        assert stats["api.jup.ag"].acquired == 1
+        assert limiter.stats()["api.jup.ag"].acquired == 2
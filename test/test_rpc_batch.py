@@ -0,0 +1,165 @@
+import json
+import base64
+import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.http_session import HTTPSessionPool
+from src.rpc_batch import BatchRPCClient, RPCError
+from src.spl_layout import TOKEN_2022_PROGRAM_ID, TOKEN_PROGRAM_ID
+from test_spl_layout import mint_data
+
+
+def encoded(data, owner):
+    return {
+        "data": [base64.b64encode(data).decode("utf-8"), "base64"],
+        "owner": owner,
+        "lamports": 1461600,
+        "executable": False,
+        "rentEpoch": 0
+    }
+
+
+ACCOUNTS = {
+    "USDC": encoded(mint_data(6), TOKEN_PROGRAM_ID),
+    "BONK": encoded(mint_data(5), TOKEN_PROGRAM_ID),
+    "PYUSD": encoded(
+        mint_data(6, token_2022_extensions=b"\x01\x00\x00\x00"),
+        TOKEN_2022_PROGRAM_ID
+    ),
+    "WALLET": encoded(bytes(0), "11111111111111111111111111111111"),
+    "BROKEN": encoded(bytes(10), TOKEN_PROGRAM_ID),
+}
+
+
+class StandInRPC:
+    def __init__(self):
+        self.http_requests = []
+
+    def handle(self, request):
+        method = request.get("method")
+        if method == "getMultipleAccounts":
+            addresses = request["params"][0]
+            if len(addresses) > 100:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "error": {"code": -32602, "message": "Too many inputs"}
+                }
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "result": {
+                    "context": {"slot": 1},
+                    "value": [ACCOUNTS.get(a) for a in addresses]
+                }
+            }
+        if method == "getSlot":
+            return {"jsonrpc": "2.0", "id": request["id"], "result": 42}
+        return {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "error": {"code": -32601, "message": "Method not found"}
+        }
+
+
+@pytest.fixture
+def stand_in():
+    rpc = StandInRPC()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length))
+            rpc.http_requests.append(payload)
+            if isinstance(payload, list):
+                reply = [rpc.handle(request) for request in reversed(payload)]
+            else:
+                reply = rpc.handle(payload)
+            body = json.dumps(reply).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    rpc.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield rpc
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stand_in):
+    pool = HTTPSessionPool()
+    yield BatchRPCClient(stand_in.url, session_pool=pool)
+    pool.close()
+
+
+class TestBatchRPCClient:
+    def test_single_call(self, client):
+        assert client.call("getSlot") == 42
+
+    def test_single_call_error(self, client):
+        with pytest.raises(RPCError) as exc_info:
+            client.call("nope")
+        assert exc_info.value.code == -32601
+
+    def test_batch_returns_results_in_request_order(self, client, stand_in):
+        results = client.batch([("getSlot", None)] * 3)
+        assert results == [42, 42, 42]
+        assert len(stand_in.http_requests) == 1
+
+    def test_batch_empty(self, client, stand_in):
+        assert client.batch([]) == []
+        assert stand_in.http_requests == []
+
+    def test_batch_raises_on_error(self, client):
+        with pytest.raises(RPCError):
+            client.batch([("getSlot", None), ("nope", None)])
+
+    def test_batch_can_return_errors(self, client):
+        results = client.batch(
+            [("getSlot", None), ("nope", None)], raise_errors=False
+        )
+        assert results[0] == 42
+        assert isinstance(results[1], RPCError)
+
+    def test_get_mint_decimals(self, client):
+        decimals = client.get_mint_decimals(
+            ["USDC", "BONK", "PYUSD", "MISSING", "WALLET", "BROKEN"]
+        )
+        assert decimals == {
+            "USDC": 6,
+            "BONK": 5,
+            "PYUSD": 6,
+            "MISSING": None,
+            "WALLET": None,
+            "BROKEN": None
+        }
+
+    def test_get_mint_decimals_chunks_in_one_http_request(
+        self, client, stand_in
+    ):
+        mints = ["USDC"] + [f"UNKNOWN_{i}" for i in range(249)]
+        decimals = client.get_mint_decimals(mints)
+
+        assert len(decimals) == 250
+        assert decimals["USDC"] == 6
+        assert len(stand_in.http_requests) == 1
+        batch = stand_in.http_requests[0]
+        assert [len(request["params"][0]) for request in batch] == [
+            100, 100, 50
+        ]
+
+    def test_get_mint_decimals_deduplicates(self, client, stand_in):
+        client.get_mint_decimals(["USDC", "USDC", "BONK"])
+        batch = stand_in.http_requests[0]
+        assert batch[0]["params"][0] == ["USDC", "BONK"]
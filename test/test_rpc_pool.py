@@ -0,0 +1,188 @@
+import pytest
+import threading
+from src.rpc_pool import RPCEndpointPool
+from fake_clock import install_fake_clock
+
+
+class FakeClient:
+    def __init__(self, rpc_url, clock):
+        self.rpc_url = rpc_url
+        self.clock = clock
+        self.latency = 0.1
+        self.fail = False
+        self.slot_calls = 0
+
+    def get_slot(self):
+        self.slot_calls += 1
+        self.clock.now += self.latency
+        if self.fail:
+            raise ConnectionError(f"{self.rpc_url} unreachable")
+        return 42
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return install_fake_clock(monkeypatch, "src.rpc_pool")
+
+
+@pytest.fixture
+def pool(clock):
+    return RPCEndpointPool(
+        ["https://a", "https://b", "https://c"],
+        client_factory=lambda url: FakeClient(url, clock),
+        alpha=0.5,
+        failure_threshold=2,
+        ejection_time=30
+    )
+
+
+def set_latencies(pool, **latencies):
+    for name, latency in latencies.items():
+        pool.client(f"https://{name}").latency = latency
+
+
+class TestRPCEndpointPool:
+    def test_requires_endpoints(self):
+        with pytest.raises(ValueError):
+            RPCEndpointPool([], client_factory=lambda url: None)
+
+    def test_invalid_alpha(self):
+        with pytest.raises(ValueError):
+            RPCEndpointPool(
+                ["https://a"], client_factory=lambda url: None, alpha=0
+            )
+
+    def test_one_client_per_endpoint(self, pool):
+        assert pool.client("https://a").rpc_url == "https://a"
+        assert pool.client("https://a") is pool.client("https://a")
+
+    def test_unmeasured_endpoints_are_tried_first(self, pool):
+        pool.record_success("https://a", 0.01)
+        assert pool.select() == "https://b"
+
+    def test_failed_unmeasured_endpoint_ranks_last(self, pool):
+        pool.record_failure("https://a", ConnectionError())
+        pool.record_success("https://b", 0.5)
+        pool.record_success("https://c", 0.9)
+        assert pool.select() == "https://b"
+
+    def test_dead_endpoint_gets_no_caller_traffic(self, clock):
+        pool = RPCEndpointPool(
+            ["https://dead", "https://good"],
+            client_factory=lambda url: FakeClient(url, clock),
+            failure_threshold=3,
+            ejection_time=30
+        )
+        pool.client("https://dead").fail = True
+        pool.probe_all()
+
+        for _ in range(3):
+            for _ in range(5):
+                assert pool.call(lambda client: client.get_slot()) == 42
+            pool.probe_all()
+            clock.now += 30
+
+        # Only the four probes reached the dead endpoint.
+        assert pool.client("https://dead").slot_calls == 4
+
+    def test_readmitted_endpoint_gets_single_trial(self, pool, clock):
+        set_latencies(pool, a=0.01, b=0.2, c=0.3)
+        pool.probe_all()
+        pool.record_failure("https://a", ConnectionError())
+        pool.record_failure("https://a", ConnectionError())
+        clock.now += 30
+        assert pool.select() == "https://a"
+
+        pool.record_failure("https://a", ConnectionError())
+        assert not pool.stats()["https://a"].healthy
+
+    def test_tracked_client_records_outcomes(self, pool):
+        set_latencies(pool, a=0.01, b=0.2, c=0.3)
+        pool.probe_all()
+        tracked = pool.tracked_client()
+
+        assert tracked.get_slot() == 42
+        assert tracked.rpc_url == "https://a"
+        assert pool.stats()["https://a"].successes == 2
+
+        pool.client("https://a").fail = True
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                tracked.get_slot()
+        assert not pool.stats()["https://a"].healthy
+        assert tracked.get_slot() == 42
+
+    def test_routes_to_fastest_endpoint(self, pool):
+        set_latencies(pool, a=0.3, b=0.05, c=0.2)
+        pool.probe_all()
+        assert pool.select() == "https://b"
+        assert pool.call(lambda client: client.rpc_url) == "https://b"
+
+    def test_ewma_latency(self, pool):
+        pool.record_success("https://a", 0.2)
+        pool.record_success("https://a", 0.4)
+        assert pool.stats()["https://a"].ewma_latency == pytest.approx(0.3)
+
+    def test_ejects_failing_endpoint(self, pool):
+        set_latencies(pool, a=0.01, b=0.2, c=0.3)
+        pool.probe_all()
+        pool.client("https://a").fail = True
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                pool.call(lambda client: client.get_slot())
+
+        stats = pool.stats()["https://a"]
+        assert not stats.healthy
+        assert stats.failures == 2
+        assert "unreachable" in stats.last_error
+        assert pool.select() == "https://b"
+
+    def test_ejected_endpoint_returns_after_timeout(self, pool, clock):
+        set_latencies(pool, a=0.01, b=0.2, c=0.3)
+        pool.probe_all()
+        pool.record_failure("https://a", ConnectionError())
+        pool.record_failure("https://a", ConnectionError())
+        assert pool.select() == "https://b"
+
+        clock.now += 30
+        assert pool.select() == "https://a"
+
+    def test_successful_probe_readmits_endpoint(self, pool):
+        pool.record_failure("https://a", ConnectionError())
+        pool.record_failure("https://a", ConnectionError())
+        assert not pool.stats()["https://a"].healthy
+
+        pool.probe_all()
+        assert pool.stats()["https://a"].healthy
+
+    def test_all_ejected_uses_first_due_back(self, pool, clock):
+        for url in ("https://b", "https://a", "https://c"):
+            pool.record_failure(url, ConnectionError())
+            pool.record_failure(url, ConnectionError())
+            clock.now += 1
+        assert pool.select() == "https://b"
+
+    def test_stats_are_snapshots(self, pool):
+        stats = pool.stats()
+        pool.record_success("https://a", 0.1)
+        assert stats["https://a"].successes == 0
+
+    def test_background_prober(self, clock):
+        probed = threading.Event()
+
+        def probe(client):
+            probed.set()
+
+        pool = RPCEndpointPool(
+            ["https://a"],
+            client_factory=lambda url: FakeClient(url, clock),
+            probe=probe,
+            probe_interval=60
+        )
+        pool.start()
+        try:
+            assert probed.wait(timeout=5)
+        finally:
+            pool.stop()
+        assert pool.stats()["https://a"].successes >= 1
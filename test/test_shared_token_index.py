@@ -0,0 +1,192 @@
+import os
+import time
+import pytest
+import multiprocessing
+from src.tokens import Token
+from src.token_snapshot import SnapshotError, write_snapshot
+from src.shared_token_index import (
+    IndexLockedError,
+    SharedTokenIndex,
+    TokenIndexPublisher
+)
+from fake_clock import install_fake_clock
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return install_fake_clock(monkeypatch, "src.shared_token_index")
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return tmp_path / "tokens.snapshot"
+
+
+@pytest.fixture
+def publisher(index_path):
+    publisher = TokenIndexPublisher(index_path, delay=60)
+    yield publisher
+    publisher.close()
+
+
+def make_token(i):
+    return Token(
+        address=f"mint{i}", name=f"Token{i}", symbol=f"T{i}", decimals=6
+    )
+
+
+def lookup_in_child(path, address, queue):
+    index = SharedTokenIndex(path)
+    queue.put((index.generation, index.get(address)))
+
+
+class TestTokenIndexPublisher:
+    def test_publish_writes_next_generation(self, publisher, index_path):
+        publisher.add_tokens([make_token(1), make_token(2)])
+        assert publisher.publish() == 2
+        assert publisher.generation == 1
+
+        index = SharedTokenIndex(index_path)
+        assert index.generation == 1
+        assert index == {"mint1": make_token(1), "mint2": make_token(2)}
+
+    def test_publish_merges_with_previous(self, publisher, index_path):
+        publisher.add_token(make_token(1))
+        publisher.publish()
+        publisher.add_token(make_token(2))
+        publisher.publish()
+
+        assert set(SharedTokenIndex(index_path)) == {"mint1", "mint2"}
+
+    def test_resumes_from_existing_snapshot(self, index_path):
+        write_snapshot(index_path, [make_token(1)], generation=5)
+        publisher = TokenIndexPublisher(index_path, delay=60)
+        publisher.add_token(make_token(2))
+        publisher.close()
+
+        index = SharedTokenIndex(index_path)
+        assert index.generation == 6
+        assert set(index) == {"mint1", "mint2"}
+
+    def test_second_publisher_is_rejected(self, publisher, index_path):
+        with pytest.raises(IndexLockedError):
+            TokenIndexPublisher(index_path)
+
+    def test_lock_released_on_close(self, index_path):
+        TokenIndexPublisher(index_path).close()
+        publisher = TokenIndexPublisher(index_path)
+        publisher.close()
+        publisher.close()
+
+    def test_lock_released_on_unreadable_snapshot(self, index_path):
+        index_path.write_bytes(b"garbage")
+        with pytest.raises(SnapshotError):
+            TokenIndexPublisher(index_path)
+        index_path.unlink()
+        TokenIndexPublisher(index_path).close()
+
+    def test_failing_publish_backs_off(self, monkeypatch, index_path):
+        calls = []
+
+        def failing_write(*args):
+            calls.append(args)
+            raise OSError("disk full")
+
+        monkeypatch.setattr(
+            "src.shared_token_index.write_snapshot", failing_write
+        )
+        publisher = TokenIndexPublisher(index_path, delay=0.05)
+        publisher.add_tokens([make_token(i) for i in range(100)])
+        time.sleep(0.3)
+        monkeypatch.undo()
+        publisher.close()
+
+        assert 1 <= len(calls) <= 5
+
+    def test_publishes_after_delay(self, index_path):
+        publisher = TokenIndexPublisher(index_path, delay=0.01)
+        index = SharedTokenIndex(index_path, refresh_interval=0)
+        publisher.add_token(make_token(1))
+
+        deadline = time.monotonic() + 5
+        while "mint1" not in index and time.monotonic() < deadline:
+            time.sleep(0.01)
+        publisher.close()
+        assert "mint1" in index
+
+
+class TestSharedTokenIndex:
+    def test_missing_index_is_empty(self, index_path):
+        index = SharedTokenIndex(index_path)
+        assert len(index) == 0
+        assert index.generation == 0
+        assert "mint1" not in index
+        with pytest.raises(KeyError):
+            index["mint1"]
+
+    def test_sees_updates_after_refresh_interval(
+        self, clock, publisher, index_path
+    ):
+        publisher.add_token(make_token(1))
+        publisher.publish()
+        index = SharedTokenIndex(index_path, refresh_interval=1.0)
+        assert "mint2" not in index
+
+        publisher.add_token(make_token(2))
+        publisher.publish()
+        clock.now += 0.5
+        assert "mint2" not in index
+
+        clock.now += 0.5
+        assert index["mint2"] == make_token(2)
+        assert index.generation == 2
+
+    def test_picks_up_index_created_later(
+        self, clock, publisher, index_path
+    ):
+        index = SharedTokenIndex(index_path, refresh_interval=1.0)
+        publisher.add_token(make_token(1))
+        publisher.publish()
+        clock.now += 1
+        assert "mint1" in index
+
+    def test_refresh_skips_unchanged_file(self, publisher, index_path):
+        publisher.add_token(make_token(1))
+        publisher.publish()
+        index = SharedTokenIndex(index_path, refresh_interval=0)
+        assert not index.refresh()
+
+    def test_keeps_old_snapshot_on_bad_file(
+        self, clock, publisher, index_path
+    ):
+        publisher.add_token(make_token(1))
+        publisher.publish()
+        index = SharedTokenIndex(index_path, refresh_interval=1.0)
+
+        bad_path = index_path.with_suffix(".tmp")
+        bad_path.write_bytes(b"garbage")
+        os.replace(bad_path, index_path)
+        clock.now += 1
+        assert index["mint1"] == make_token(1)
+
+    def test_readers_in_other_processes(self, publisher, index_path):
+        publisher.add_tokens([make_token(i) for i in range(100)])
+        publisher.publish()
+
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        workers = [
+            context.Process(
+                target=lookup_in_child, args=(index_path, f"mint{i}", queue)
+            )
+            for i in (3, 42)
+        ]
+        for worker in workers:
+            worker.start()
+        results = [queue.get(timeout=30) for _ in workers]
+        for worker in workers:
+            worker.join()
+
+        assert sorted(results, key=lambda r: r[1].address) == [
+            (1, make_token(3)), (1, make_token(42))
+        ]
@@ -0,0 +1,143 @@
+import time
+import pytest
+import threading
+from src.single_flight import SingleFlight, SingleFlightError
+
+
+@pytest.fixture
+def single_flight():
+    return SingleFlight()
+
+
+class BlockingLookup:
+    def __init__(self, error=None):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+        self.error = error
+
+    def __call__(self, address):
+        self.calls.append(address)
+        self.started.set()
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return {"name": f"Token {address}", "symbol": address[:3]}
+
+
+def run_concurrently(single_flight, lookup, key, count):
+    results = []
+    errors = []
+    lock = threading.Lock()
+
+    def worker():
+        try:
+            result = single_flight.do(key, lookup, key)
+            with lock:
+                results.append(result)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    lookup.started.wait(timeout=5)
+
+    followers = [threading.Thread(target=worker) for _ in range(count - 1)]
+    for t in followers:
+        t.start()
+    while single_flight.stats().coalesced < count - 1:
+        time.sleep(0.001)
+    lookup.release.set()
+
+    for t in [leader, *followers]:
+        t.join()
+    return results, errors
+
+
+class TestSingleFlight:
+    def test_single_call_returns_result(self, single_flight):
+        assert single_flight.do("A", lambda x: x * 2, 21) == 42
+        stats = single_flight.stats()
+        assert stats.executed == 1
+        assert stats.coalesced == 0
+        assert stats.in_flight == 0
+
+    def test_concurrent_calls_are_coalesced(self, single_flight):
+        lookup = BlockingLookup()
+        results, errors = run_concurrently(
+            single_flight, lookup, "MINT", 10
+        )
+
+        assert errors == []
+        assert lookup.calls == ["MINT"]
+        assert len(results) == 10
+        assert all(result is results[0] for result in results)
+        assert single_flight.stats().executed == 1
+        assert single_flight.stats().coalesced == 9
+
+    def test_errors_are_shared_with_waiters(self, single_flight):
+        lookup = BlockingLookup(error=ValueError("No pairs found"))
+        results, errors = run_concurrently(
+            single_flight, lookup, "SPAM", 5
+        )
+
+        assert results == []
+        assert len(errors) == 5
+        assert all(isinstance(e, ValueError) for e in errors)
+        assert lookup.calls == ["SPAM"]
+
+    def test_waiters_get_their_own_exception(self, single_flight):
+        original = ValueError("No pairs found")
+        lookup = BlockingLookup(error=original)
+        results, errors = run_concurrently(
+            single_flight, lookup, "SPAM", 5
+        )
+
+        assert len({id(e) for e in errors}) == 5
+        waiters = [e for e in errors if e is not original]
+        assert len(waiters) == 4
+        assert all(e.__cause__ is original for e in waiters)
+        assert all(str(e) == "No pairs found" for e in waiters)
+
+    def test_uncopyable_error_raises_single_flight_error(
+        self, single_flight
+    ):
+        class UncopyableError(Exception):
+            def __init__(self, code, message):
+                super().__init__(message)
+
+        original = UncopyableError(1, "boom")
+        lookup = BlockingLookup(error=original)
+        results, errors = run_concurrently(
+            single_flight, lookup, "SPAM", 3
+        )
+
+        waiters = [e for e in errors if e is not original]
+        assert len(waiters) == 2
+        assert all(isinstance(e, SingleFlightError) for e in waiters)
+        assert all(e.__cause__ is original for e in waiters)
+
+    def test_different_keys_run_independently(self, single_flight):
+        assert single_flight.do("A", str.lower, "A") == "a"
+        assert single_flight.do("B", str.lower, "B") == "b"
+        assert single_flight.stats().executed == 2
+
+    def test_results_are_not_cached(self, single_flight):
+        calls = []
+
+        def lookup():
+            calls.append(1)
+            return len(calls)
+
+        assert single_flight.do("A", lookup) == 1
+        assert single_flight.do("A", lookup) == 2
+
+    def test_key_released_after_error(self, single_flight):
+        def failing():
+            raise RuntimeError("rpc down")
+
+        with pytest.raises(RuntimeError):
+            single_flight.do("A", failing)
+        assert single_flight.stats().in_flight == 0
+        assert single_flight.do("A", lambda: "ok") == "ok"
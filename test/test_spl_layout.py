@@ -0,0 +1,110 @@
+import struct
+import pytest
+from src.spl_layout import (
+    ACCOUNT_SIZE,
+    ACCOUNT_TYPE_ACCOUNT,
+    ACCOUNT_TYPE_MINT,
+    MINT_SIZE,
+    LayoutError,
+    decode_mint,
+    decode_token_account
+)
+
+
+def mint_data(decimals, supply=0, token_2022_extensions=None):
+    data = struct.pack(
+        "<I32sQBBI32s",
+        1, bytes(range(32)), supply, decimals, 1, 0, bytes(32)
+    )
+    assert len(data) == MINT_SIZE
+    if token_2022_extensions is not None:
+        data += bytes(ACCOUNT_SIZE - MINT_SIZE)
+        data += bytes([ACCOUNT_TYPE_MINT]) + token_2022_extensions
+    return data
+
+
+def token_account_data(mint, amount, state=1, token_2022_extensions=None):
+    data = struct.pack(
+        "<32s32sQI32sBIQQI32s",
+        mint, bytes(32), amount, 0, bytes(32), state, 0, 0, 0, 0, bytes(32)
+    )
+    assert len(data) == ACCOUNT_SIZE
+    if token_2022_extensions is not None:
+        data += bytes([ACCOUNT_TYPE_ACCOUNT]) + token_2022_extensions
+    return data
+
+
+class TestDecodeMint:
+    def test_classic_mint(self):
+        info = decode_mint(mint_data(6, supply=1_000_000))
+        assert info.decimals == 6
+        assert info.supply == 1_000_000
+        assert info.is_initialized
+
+    def test_token_2022_mint_with_extensions(self):
+        extensions = struct.pack("<HH", 3, 4) + b"\x01\x02\x03\x04"
+        info = decode_mint(
+            mint_data(9, supply=2**64 - 1, token_2022_extensions=extensions)
+        )
+        assert info.decimals == 9
+        assert info.supply == 2**64 - 1
+
+    def test_too_short(self):
+        with pytest.raises(LayoutError):
+            decode_mint(mint_data(6)[:40])
+
+    def test_token_account_is_not_a_mint(self):
+        with pytest.raises(LayoutError):
+            decode_mint(bytes(ACCOUNT_SIZE))
+
+    def test_wrong_account_type(self):
+        data = bytearray(mint_data(6, token_2022_extensions=b""))
+        data[ACCOUNT_SIZE] = ACCOUNT_TYPE_ACCOUNT
+        with pytest.raises(LayoutError):
+            decode_mint(bytes(data))
+
+
+class TestDecodeTokenAccount:
+    def test_classic_account(self):
+        mint = bytes(range(32))
+        decoded_mint, amount = decode_token_account(
+            token_account_data(mint, 123450000000)
+        )
+        assert bytes(decoded_mint) == mint
+        assert amount == 123450000000
+
+    def test_mint_is_a_view_over_the_input(self):
+        data = bytearray(token_account_data(bytes(32), 1))
+        decoded_mint, _ = decode_token_account(data)
+        data[0] = 7
+        assert decoded_mint[0] == 7
+
+    def test_accepts_memoryview(self):
+        data = memoryview(token_account_data(b"\x01" * 32, 2**64 - 1))
+        _, amount = decode_token_account(data)
+        assert amount == 2**64 - 1
+
+    def test_token_2022_account_with_extensions(self):
+        extensions = struct.pack("<HH", 7, 0)
+        mint = bytes(range(1, 33))
+        decoded_mint, amount = decode_token_account(
+            token_account_data(mint, 5, token_2022_extensions=extensions)
+        )
+        assert bytes(decoded_mint) == mint
+        assert amount == 5
+
+    def test_mint_is_not_a_token_account(self):
+        with pytest.raises(LayoutError):
+            decode_token_account(mint_data(6))
+        with pytest.raises(LayoutError):
+            decode_token_account(
+                mint_data(6, token_2022_extensions=bytes(8))
+            )
+
+    def test_uninitialized_account(self):
+        with pytest.raises(LayoutError):
+            decode_token_account(token_account_data(bytes(32), 1, state=0))
+
+    def test_too_short(self):
+        with pytest.raises(LayoutError):
+            decode_token_account(bytes(72))
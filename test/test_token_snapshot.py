@@ -0,0 +1,124 @@
+import pytest
+from src.tokens import Token
+from src.token_snapshot import (
+    HEADER, SnapshotError, TokenSnapshot, encode_snapshot, write_snapshot
+)
+
+
+@pytest.fixture
+def sample_tokens():
+    return [
+        Token(address="B", name="TokenB", symbol="TKB", decimals=8),
+        Token(address="A", name="TokenA", symbol="TKA", decimals=18),
+        Token(address="C", name="Tökén ☃", symbol="SNOW", decimals=0)
+    ]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, sample_tokens):
+    path = tmp_path / "tokens.snapshot"
+    write_snapshot(path, sample_tokens, generation=7)
+    return path
+
+
+@pytest.fixture
+def snapshot(snapshot_path):
+    with TokenSnapshot(snapshot_path) as snapshot:
+        yield snapshot
+
+
+class TestTokenSnapshot:
+    def test_round_trip(self, snapshot, sample_tokens):
+        assert snapshot == {t.address: t for t in sample_tokens}
+
+    def test_header(self, snapshot):
+        assert len(snapshot) == 3
+        assert snapshot.generation == 7
+
+    def test_materializes_on_first_access(self, snapshot, sample_tokens):
+        assert snapshot.materialized == 0
+        assert "A" in snapshot
+        assert snapshot.materialized == 0
+
+        token = snapshot["C"]
+        assert token == sample_tokens[2]
+        assert snapshot.materialized == 1
+        assert snapshot["C"] is token
+
+    def test_missing_address(self, snapshot):
+        with pytest.raises(KeyError):
+            snapshot["missing"]
+        assert "missing" not in snapshot
+        assert 42 not in snapshot
+        assert snapshot.get("0") is None
+
+    def test_iterates_in_address_order(self, snapshot):
+        assert list(snapshot) == ["A", "B", "C"]
+
+    def test_last_duplicate_wins(self, tmp_path):
+        path = tmp_path / "tokens.snapshot"
+        write_snapshot(path, [
+            Token(address="A", name="Old", symbol="OLD", decimals=6),
+            Token(address="A", name="New", symbol="NEW", decimals=9)
+        ])
+        with TokenSnapshot(path) as snapshot:
+            assert len(snapshot) == 1
+            assert snapshot["A"].symbol == "NEW"
+
+    def test_many_tokens(self, tmp_path):
+        tokens = [
+            Token(address=f"mint{i:05}", name=f"T{i}", symbol=f"T{i}",
+                  decimals=i % 19)
+            for i in range(1000)
+        ]
+        path = tmp_path / "tokens.snapshot"
+        write_snapshot(path, reversed(tokens))
+        with TokenSnapshot(path) as snapshot:
+            for token in tokens[::37]:
+                assert snapshot[token.address] == token
+            assert "mint01000" not in snapshot
+
+    def test_empty_snapshot(self, tmp_path):
+        path = tmp_path / "tokens.snapshot"
+        write_snapshot(path, [])
+        with TokenSnapshot(path) as snapshot:
+            assert len(snapshot) == 0
+            assert "A" not in snapshot
+
+    def test_write_leaves_no_temp_files(self, snapshot_path):
+        assert [p.name for p in snapshot_path.parent.iterdir()] == [
+            "tokens.snapshot"
+        ]
+
+    def test_field_too_long(self):
+        token = Token(address="A", name="x" * 70000, symbol="X", decimals=0)
+        with pytest.raises(SnapshotError):
+            encode_snapshot([token])
+
+
+class TestInvalidSnapshot:
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "tokens.snapshot"
+        path.write_bytes(b"")
+        with pytest.raises(SnapshotError):
+            TokenSnapshot(path)
+
+    def test_wrong_magic(self, tmp_path):
+        path = tmp_path / "tokens.snapshot"
+        path.write_bytes(b"[]" + bytes(HEADER.size))
+        with pytest.raises(SnapshotError):
+            TokenSnapshot(path)
+
+    def test_unsupported_version(self, snapshot_path):
+        data = bytearray(snapshot_path.read_bytes())
+        data[4] = 99
+        snapshot_path.write_bytes(bytes(data))
+        with pytest.raises(SnapshotError):
+            TokenSnapshot(snapshot_path)
+
+    @pytest.mark.parametrize("size", [10, HEADER.size + 5, -1])
+    def test_truncated(self, snapshot_path, size):
+        data = snapshot_path.read_bytes()
+        snapshot_path.write_bytes(data[:size])
+        with pytest.raises(SnapshotError):
+            TokenSnapshot(snapshot_path)
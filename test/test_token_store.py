@@ -0,0 +1,252 @@
+import json
+import pytest
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+from src.tokens import Token
+from src.token_store import TokenCache, TokenStore
+
+
+@pytest.fixture
+def sample_tokens():
+    return [
+        Token(address="A", name="TokenA", symbol="TKA", decimals=18),
+        Token(address="B", name="TokenB", symbol="TKB", decimals=8)
+    ]
+
+
+@pytest.fixture
+def test_db(tmp_path):
+    yield Path(tmp_path / "tokens.db")
+
+
+@pytest.fixture
+def token_store(test_db):
+    return TokenStore(db_path=test_db)
+
+
+class TestTokenStore:
+    def test_save_and_load_token(self, token_store, sample_tokens):
+        token_store.save_token(sample_tokens[0])
+        assert token_store.load_token("A") == sample_tokens[0]
+
+    def test_load_missing_token_returns_none(self, token_store):
+        assert token_store.load_token("missing") is None
+
+    def test_save_token_upserts(self, token_store):
+        token_store.save_token(
+            Token(address="A", name="Old", symbol="OLD", decimals=6)
+        )
+        token_store.save_token(
+            Token(address="A", name="New", symbol="NEW", decimals=9)
+        )
+        assert token_store.count() == 1
+        assert token_store.load_token("A").symbol == "NEW"
+
+    def test_load_tokens_by_symbol(self, token_store):
+        token_store.save_tokens([
+            Token(address="C", name="Fake USDC", symbol="USDC", decimals=6),
+            Token(address="B", name="USD Coin", symbol="USDC", decimals=6),
+            Token(address="D", name="Other", symbol="OTH", decimals=6)
+        ])
+        tokens = token_store.load_tokens_by_symbol("USDC")
+        assert [t.address for t in tokens] == ["B", "C"]
+
+    def test_symbol_lookup_uses_index(self, token_store, test_db):
+        with sqlite3.connect(test_db) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM tokens WHERE symbol = ?",
+                ("USDC",)
+            ).fetchall()
+        assert "idx_tokens_symbol" in " ".join(str(row) for row in plan)
+
+    def test_load_all_tokens(self, token_store, sample_tokens):
+        token_store.save_tokens(sample_tokens)
+        assert token_store.load_all_tokens() == {
+            t.address: t for t in sample_tokens
+        }
+
+    def test_token_exists_and_delete(self, token_store, sample_tokens):
+        token_store.save_token(sample_tokens[0])
+        assert token_store.token_exists("A")
+        token_store.delete_token("A")
+        assert not token_store.token_exists("A")
+
+    def test_migrate_json(self, token_store, sample_tokens, tmp_path):
+        json_path = tmp_path / "tokens.json"
+        json_path.write_text(
+            json.dumps([t.model_dump() for t in sample_tokens], indent=4)
+        )
+
+        assert token_store.migrate_json(json_path) == 2
+        assert token_store.load_all_tokens() == {
+            t.address: t for t in sample_tokens
+        }
+
+    def test_migrate_json_runs_once(
+        self, token_store, sample_tokens, tmp_path
+    ):
+        json_path = tmp_path / "tokens.json"
+        json_path.write_text(
+            json.dumps([t.model_dump() for t in sample_tokens])
+        )
+        token_store.migrate_json(json_path)
+        token_store.delete_token("A")
+
+        assert token_store.migrate_json(json_path) == 0
+        assert not token_store.token_exists("A")
+
+    def test_concurrent_migration_imports_once(
+        self, test_db, token_store, sample_tokens, tmp_path
+    ):
+        json_path = tmp_path / "tokens.json"
+        json_path.write_text(
+            json.dumps([t.model_dump() for t in sample_tokens])
+        )
+        other_store = TokenStore(db_path=test_db)
+        real_load = json.load
+
+        def load_then_migrate_elsewhere(file):
+            # Another process finishes the same migration while this one
+            # is still reading the file, then the user deletes a token.
+            entries = real_load(file)
+            with patch("src.token_store.json.load", real_load):
+                assert other_store.migrate_json(json_path) == 2
+            other_store.delete_token("A")
+            return entries
+
+        with patch(
+            "src.token_store.json.load", load_then_migrate_elsewhere
+        ):
+            assert token_store.migrate_json(json_path) == 0
+        assert not token_store.token_exists("A")
+
+    def test_migrate_json_does_not_overwrite_newer_rows(
+        self, token_store, sample_tokens, tmp_path
+    ):
+        newer = Token(address="A", name="Renamed", symbol="TKA", decimals=18)
+        token_store.save_token(newer)
+        json_path = tmp_path / "tokens.json"
+        json_path.write_text(
+            json.dumps([t.model_dump() for t in sample_tokens])
+        )
+
+        token_store.migrate_json(json_path)
+
+        assert token_store.load_token("A") == newer
+
+    def test_migrate_missing_json(self, token_store, tmp_path):
+        assert token_store.migrate_json(tmp_path / "nonexistent.json") == 0
+
+    def test_migrate_invalid_json(self, token_store, tmp_path):
+        json_path = tmp_path / "invalid.json"
+        json_path.write_text("this is not valid json")
+
+        with pytest.raises(Exception) as exc_info:
+            token_store.migrate_json(json_path)
+        assert "Error migrating tokens" in str(exc_info.value)
+        assert token_store.count() == 0
+
+    def test_store_persists_across_instances(self, test_db, sample_tokens):
+        TokenStore(test_db).save_tokens(sample_tokens)
+        assert TokenStore(test_db).load_token("B") == sample_tokens[1]
+
+
+class TestNegativeCache:
+    @pytest.fixture
+    def clock(self):
+        with patch("src.token_store.time") as clock:
+            clock.return_value = 1000.0
+            yield clock
+
+    def test_records_failure_with_reason(self, token_store, clock):
+        token_store.record_failure("spam", "no DEXScreener pairs", ttl=60)
+        assert token_store.failure_reason("spam") == "no DEXScreener pairs"
+        assert token_store.failure_reason("other") is None
+
+    def test_failure_expires(self, token_store, clock):
+        token_store.record_failure("spam", "no pairs", ttl=60)
+        clock.return_value = 1060.0
+        assert token_store.failure_reason("spam") is None
+
+    def test_default_ttl(self, token_store, clock):
+        token_store.record_failure("spam", "no pairs")
+        clock.return_value = 1000.0 + TokenStore.DEFAULT_FAILURE_TTL - 1
+        assert token_store.failure_reason("spam") == "no pairs"
+
+    def test_failed_mints_filters_batch(self, token_store, clock):
+        token_store.record_failure("spam1", "no pairs", ttl=60)
+        token_store.record_failure("spam2", "rpc error", ttl=10)
+        clock.return_value = 1030.0
+
+        addresses = ["A", "spam1", "spam2"] + [f"m{i}" for i in range(600)]
+        assert token_store.failed_mints(addresses) == {"spam1": "no pairs"}
+
+    def test_record_failure_refreshes_entry(self, token_store, clock):
+        token_store.record_failure("spam", "no pairs", ttl=60)
+        clock.return_value = 1050.0
+        token_store.record_failure("spam", "rpc error", ttl=60)
+        clock.return_value = 1100.0
+        assert token_store.failure_reason("spam") == "rpc error"
+
+    def test_saving_token_clears_failure(
+        self, token_store, sample_tokens, clock
+    ):
+        token_store.record_failure("A", "no pairs", ttl=60)
+        token_store.save_token(sample_tokens[0])
+        assert token_store.failure_reason("A") is None
+
+    def test_clear_failure(self, token_store, clock):
+        token_store.record_failure("spam", "no pairs", ttl=60)
+        token_store.clear_failure("spam")
+        assert token_store.failure_reason("spam") is None
+
+    def test_prune_failures(self, token_store, clock, test_db):
+        token_store.record_failure("old", "no pairs", ttl=10)
+        token_store.record_failure("new", "no pairs", ttl=100)
+        clock.return_value = 1050.0
+
+        assert token_store.prune_failures() == 1
+        with sqlite3.connect(test_db) as conn:
+            rows = conn.execute("SELECT address FROM failed_mints").fetchall()
+        assert rows == [("new",)]
+
+    def test_failures_persist_across_instances(self, test_db, clock):
+        TokenStore(test_db).record_failure("spam", "no pairs", ttl=60)
+        assert TokenStore(test_db).failure_reason("spam") == "no pairs"
+
+
+class TestTokenCache:
+    @pytest.fixture
+    def token_cache(self, token_store, sample_tokens):
+        token_store.save_tokens(sample_tokens)
+        return TokenCache(token_store)
+
+    def test_loads_lazily(self, token_cache, sample_tokens):
+        assert token_cache.cached == 0
+        assert token_cache["A"] == sample_tokens[0]
+        assert token_cache.cached == 1
+
+    def test_missing_key(self, token_cache):
+        with pytest.raises(KeyError):
+            token_cache["missing"]
+        assert token_cache.get("missing") is None
+
+    def test_set_writes_through(self, token_cache, token_store):
+        token = Token(address="C", name="TokenC", symbol="TKC", decimals=2)
+        token_cache["C"] = token
+        assert token_store.load_token("C") == token
+
+    def test_delete(self, token_cache, token_store):
+        del token_cache["A"]
+        assert "A" not in token_cache
+        assert not token_store.token_exists("A")
+        with pytest.raises(KeyError):
+            del token_cache["A"]
+
+    def test_dict_api(self, token_cache, sample_tokens):
+        expected = {t.address: t for t in sample_tokens}
+        assert len(token_cache) == 2
+        assert "A" in token_cache
+        assert set(token_cache) == {"A", "B"}
+        assert token_cache == expected
@@ -0,0 +1,185 @@
+import json
+import time
+import pytest
+import threading
+from src.write_behind import WriteBehindWriter, atomic_write_json
+
+
+class RecordingSink:
+    def __init__(self, fail_times=0):
+        self.batches = []
+        self.fail_times = fail_times
+        self.calls = 0
+        self.flushed = threading.Event()
+
+    def __call__(self, batch):
+        self.calls += 1
+        if self.fail_times:
+            self.fail_times -= 1
+            raise OSError("disk full")
+        self.batches.append(dict(batch))
+        self.flushed.set()
+
+
+@pytest.fixture
+def make_writer():
+    writers = []
+
+    def make(sink, **kwargs):
+        writer = WriteBehindWriter(sink, **kwargs)
+        writers.append(writer)
+        return writer
+
+    yield make
+    for writer in writers:
+        writer.close()
+
+
+class TestAtomicWriteJson:
+    def test_writes_json(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        atomic_write_json(path, [{"address": "A"}])
+        assert json.loads(path.read_text()) == [{"address": "A"}]
+
+    def test_replaces_existing_file(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text("old")
+        atomic_write_json(path, {"new": True})
+        assert json.loads(path.read_text()) == {"new": True}
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text("[]")
+
+        with pytest.raises(TypeError):
+            atomic_write_json(path, {"bad": object()})
+
+        assert path.read_text() == "[]"
+        assert [p.name for p in tmp_path.iterdir()] == ["tokens.json"]
+
+
+class TestWriteBehindWriter:
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            WriteBehindWriter(lambda batch: None, max_batch=0)
+
+    def test_mark_dirty_does_not_write_synchronously(self, make_writer):
+        sink = RecordingSink()
+        writer = make_writer(sink, delay=60)
+        writer.mark_dirty("A", 1)
+        assert sink.batches == []
+        assert writer.pending == 1
+
+    def test_flushes_after_delay(self, make_writer):
+        sink = RecordingSink()
+        writer = make_writer(sink, delay=0.05)
+        writer.mark_dirty("A", 1)
+        writer.mark_dirty("B", 2)
+
+        assert sink.flushed.wait(timeout=5)
+        assert sink.batches == [{"A": 1, "B": 2}]
+
+    def test_flushes_at_batch_size(self, make_writer):
+        sink = RecordingSink()
+        writer = make_writer(sink, delay=60, max_batch=3)
+        for i in range(3):
+            writer.mark_dirty(i, i)
+
+        assert sink.flushed.wait(timeout=5)
+        assert sink.batches == [{0: 0, 1: 1, 2: 2}]
+
+    def test_coalesces_repeated_keys(self, make_writer):
+        sink = RecordingSink()
+        writer = make_writer(sink, delay=60)
+        writer.mark_dirty("A", 1)
+        writer.mark_dirty("A", 2)
+        writer.flush()
+        assert sink.batches == [{"A": 2}]
+
+    def test_many_updates_few_writes(self, make_writer):
+        sink = RecordingSink()
+        writer = make_writer(sink, delay=0.05)
+        for i in range(50):
+            writer.mark_dirty(f"mint_{i}", i)
+        assert sink.flushed.wait(timeout=5)
+        time.sleep(0.1)
+
+        assert len(sink.batches) == 1
+        assert writer.items_written == 50
+
+    def test_failed_flush_is_retried(self, make_writer):
+        sink = RecordingSink(fail_times=1)
+        writer = make_writer(sink, delay=60)
+        writer.mark_dirty("A", 1)
+
+        assert writer.flush() == 0
+        assert writer.errors == 1
+        assert writer.pending == 1
+
+        writer.mark_dirty("A", 2)
+        assert writer.flush() == 1
+        assert sink.batches == [{"A": 2}]
+
+    def test_failing_sink_retries_once_per_delay(self, make_writer):
+        sink = RecordingSink(fail_times=1000)
+        writer = make_writer(
+            sink, delay=0.05, max_batch=2, max_retry_delay=0.05
+        )
+        writer.mark_dirty("A", 1)
+        writer.mark_dirty("B", 2)
+        time.sleep(0.5)
+
+        assert 3 <= sink.calls <= 12
+        assert writer.pending == 2
+
+    def test_retry_delay_grows(self, make_writer):
+        sink = RecordingSink(fail_times=1000)
+        writer = make_writer(sink, delay=0.05, max_batch=1)
+        writer.mark_dirty("A", 1)
+        time.sleep(0.5)
+
+        assert 2 <= sink.calls <= 5
+
+    def test_retry_recovers(self, make_writer):
+        sink = RecordingSink(fail_times=1)
+        writer = make_writer(sink, delay=0.01, max_batch=1)
+        writer.mark_dirty("A", 1)
+
+        assert sink.flushed.wait(timeout=5)
+        assert sink.batches == [{"A": 1}]
+        assert writer.errors == 1
+
+    def test_close_flushes_pending(self, make_writer):
+        sink = RecordingSink()
+        writer = make_writer(sink, delay=60)
+        writer.mark_dirty("A", 1)
+        writer.close()
+
+        assert sink.batches == [{"A": 1}]
+        with pytest.raises(RuntimeError):
+            writer.mark_dirty("B", 2)
+
+    def test_close_without_writes(self, make_writer):
+        sink = RecordingSink()
+        writer = make_writer(sink)
+        writer.close()
+        writer.close()
+        assert sink.batches == []
+
+    def test_writes_json_file(self, make_writer, tmp_path):
+        path = tmp_path / "tokens.json"
+        tokens = {}
+
+        def save(batch):
+            tokens.update(batch)
+            atomic_write_json(path, list(tokens.values()))
+
+        writer = make_writer(save, delay=60)
+        writer.mark_dirty("A", {"address": "A", "decimals": 6})
+        writer.mark_dirty("B", {"address": "B", "decimals": 9})
+        writer.close()
+
+        assert json.loads(path.read_text()) == [
+            {"address": "A", "decimals": 6},
+            {"address": "B", "decimals": 9}
+        ]